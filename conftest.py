@@ -0,0 +1,11 @@
+"""Root pytest configuration.
+
+Installs the Home Assistant and Bleak mocks from run_tests.py so a plain
+``pytest`` run behaves the same as ``python3 run_tests.py``.
+"""
+
+from run_tests import setup_mocks
+
+# Runs at import rather than in pytest_configure: pytest imports
+# tests/conftest.py (which imports the integration) before configure hooks
+setup_mocks()
@@ -285,6 +285,9 @@ async def async_unload_entry(
     else:
         _LOGGER.debug("No API to disconnect for %s", config_entry.unique_id)
 
+    # Drop the coordinator's registry listener and pending Push updates
+    await runtime_data.coordinator.async_shutdown()
+
     # Unload platforms
     _LOGGER.debug("Unloading platforms for %s", config_entry.unique_id)
     result = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
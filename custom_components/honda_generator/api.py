@@ -28,6 +28,7 @@ import re
 import struct
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Callable
+from collections.abc import Set as AbstractSet
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import IntEnum, StrEnum
@@ -298,6 +299,11 @@ ENGINE_ERROR_OPTIONS: list[str] = list(ENGINE_ERROR_KEYS.values())
 
 _LOGGER = logging.getLogger(__name__)
 
+# Single-bit masks for the warning/fault accessors (codes use bits up to 52)
+_BIT_COUNT = 64
+_BIT_MASKS: tuple[int, ...] = tuple(1 << i for i in range(_BIT_COUNT))
+
+
 # Sanity bounds for sensor values (to catch corrupted BLE data)
 BOUNDS_RUNTIME_HOURS = (0, 100000)  # 0 to 100k hours
 BOUNDS_CURRENT = (0.0, 50.0)  # 0 to 50 amps
@@ -669,7 +675,7 @@ class GeneratorAPIProtocol(ABC):
 
     @abstractmethod
     async def get_devices(
-        self, enabled_categories: set[DiagnosticCategory] | None = None
+        self, enabled_categories: AbstractSet[DiagnosticCategory] | None = None
     ) -> list[Device]:
         """Get all device states."""
 
@@ -1286,7 +1292,7 @@ class PollAPI(GeneratorAPIProtocol):
             _LOGGER.debug("Failed to read engine drive status: %s", exc)
 
     async def get_devices(
-        self, enabled_categories: set[DiagnosticCategory] | None = None
+        self, enabled_categories: AbstractSet[DiagnosticCategory] | None = None
     ) -> list[Device]:
         """Get all device states.
 
@@ -1379,7 +1385,7 @@ class PollAPI(GeneratorAPIProtocol):
     async def _get_value(
         self,
         device_type: DeviceType,
-        enabled_categories: set[DiagnosticCategory],
+        enabled_categories: AbstractSet[DiagnosticCategory],
     ) -> int | float | bool | str | None:
         """Get value for a device type.
 
@@ -1442,12 +1448,16 @@ class PollAPI(GeneratorAPIProtocol):
         return value
 
     def get_warning_bit(self, bit: int) -> bool:
-        """Get the state of a warning bit."""
-        return bool(self._warnings_raw & (1 << bit))
+        """Get the state of a warning bit (0-63)."""
+        if not 0 <= bit < _BIT_COUNT:
+            raise ValueError(f"Warning bit {bit} is outside the range 0-63")
+        return bool(self._warnings_raw & _BIT_MASKS[bit])
 
     def get_fault_bit(self, bit: int) -> bool:
-        """Get the state of a fault bit."""
-        return bool(self._faults_raw & (1 << bit))
+        """Get the state of a fault bit (0-63)."""
+        if not 0 <= bit < _BIT_COUNT:
+            raise ValueError(f"Fault bit {bit} is outside the range 0-63")
+        return bool(self._faults_raw & _BIT_MASKS[bit])
 
     async def engine_stop(self, max_attempts: int = 3) -> bool:
         """Stop the generator engine.
@@ -1644,6 +1654,11 @@ CAN_ECU_ERROR = 0x3A2
 CAN_INV_ERROR = 0x3B2
 CAN_BT_ERROR = 0x3A5
 
+# Big-endian u16 field layouts for CAN payloads
+_CAN_U16 = struct.Struct(">H")
+_CAN_U16X2 = struct.Struct(">HH")
+_CAN_U16X3 = struct.Struct(">HHH")
+
 # CAN IDs to actively request after starting the stream so the generator reports
 # each metric's current value (it does not always emit them unprompted).
 STATUS_REQUEST_CAN_IDS: tuple[int, ...] = (
@@ -1825,25 +1840,31 @@ class PushAPI(GeneratorAPIProtocol):
 
         elif can_id == CAN_INV_INFO:
             # INV_INFO: power (bytes 0-1), voltage (bytes 2-3), current (bytes 4-5)
-            if len(payload) >= 2:
-                self._state["power_watts"] = struct.unpack(">H", payload[0:2])[0]
-            if len(payload) >= 4:
-                self._state["voltage"] = struct.unpack(">H", payload[2:4])[0]
             if len(payload) >= 6:
-                raw_current = struct.unpack(">H", payload[4:6])[0]
+                power, voltage, raw_current = _CAN_U16X3.unpack_from(payload)
+                self._state["power_watts"] = power
+                self._state["voltage"] = voltage
                 self._state["current"] = raw_current / 500.0
+            elif len(payload) >= 4:
+                power, voltage = _CAN_U16X2.unpack_from(payload)
+                self._state["power_watts"] = power
+                self._state["voltage"] = voltage
+            else:
+                self._state["power_watts"] = _CAN_U16.unpack_from(payload)[0]
 
         elif can_id == CAN_INV_INFO2:
             # INV_INFO2: engine_hours (bytes 4-5)
             if len(payload) >= 6:
-                self._state["runtime_hours"] = struct.unpack(">H", payload[4:6])[0]
+                self._state["runtime_hours"] = _CAN_U16.unpack_from(payload, 4)[0]
 
         elif can_id == CAN_ECU_INFO_ETC:
             # ECU_INFO_ETC: fuel_ml (0-1), fuel_remains_min (2-3), fuel_level_discrete (5)
-            if len(payload) >= 2:
-                self._state["fuel_ml"] = struct.unpack(">H", payload[0:2])[0]
             if len(payload) >= 4:
-                self._state["fuel_remaining_min"] = struct.unpack(">H", payload[2:4])[0]
+                fuel_ml, fuel_remaining = _CAN_U16X2.unpack_from(payload)
+                self._state["fuel_ml"] = fuel_ml
+                self._state["fuel_remaining_min"] = fuel_remaining
+            else:
+                self._state["fuel_ml"] = _CAN_U16.unpack_from(payload)[0]
             if len(payload) >= 6:
                 self._state["fuel_level_discrete"] = payload[5]
 
@@ -2170,7 +2191,7 @@ class PushAPI(GeneratorAPIProtocol):
         return True
 
     async def get_devices(
-        self, enabled_categories: set[DiagnosticCategory] | None = None
+        self, enabled_categories: AbstractSet[DiagnosticCategory] | None = None
     ) -> list[Device]:
         """Get all device states from cached stream data.
 
@@ -2258,17 +2279,18 @@ class PushAPI(GeneratorAPIProtocol):
     def get_warning_bit(self, bit: int) -> bool:
         """Get the state of a warning bit (from CAN error data)."""
         # For Push, warnings come from CAN error messages
-        return bit in self._state.get("ecu_errors", [])
+        return bit in self._state.get("ecu_errors", ())
 
     def get_fault_bit(self, bit: int) -> bool:
         """Get the state of a fault bit (from CAN error data)."""
-        # For Push, faults come from CAN error messages
-        all_errors = (
-            self._state.get("ecu_errors", [])
-            + self._state.get("inv_errors", [])
-            + self._state.get("bt_errors", [])
+        # For Push, faults come from CAN error messages (checked in place,
+        # without concatenating the per-unit lists on every call)
+        state = self._state
+        return (
+            bit in state.get("ecu_errors", ())
+            or bit in state.get("inv_errors", ())
+            or bit in state.get("bt_errors", ())
         )
-        return bit in all_errors
 
 
 class APIError(Exception):
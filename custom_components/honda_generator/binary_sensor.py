@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
@@ -33,8 +34,8 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import DeviceType, get_model_spec
 from .codes import AlertCode, get_fault_codes, get_warning_codes
-from .const import DOMAIN
-from .entity import HondaGeneratorEntity
+from .const import DOMAIN, INVALID_RESTORE_STATES
+from .entity import HondaGeneratorEntity, LastUpdateAttributesMixin
 from .services import (
     OIL_CHANGE_BREAKIN_INTERVAL,
     ServiceType,
@@ -182,7 +183,7 @@ class HondaGeneratorBinarySensor(HondaGeneratorEntity, BinarySensorEntity):
 
 
 class HondaGeneratorAlertBinarySensor(
-    HondaGeneratorEntity, RestoreEntity, BinarySensorEntity
+    LastUpdateAttributesMixin, HondaGeneratorEntity, RestoreEntity, BinarySensorEntity
 ):
     """Binary sensor for a model-specific warning or fault code."""
 
@@ -215,11 +216,7 @@ class HondaGeneratorAlertBinarySensor(
         """Restore last state when added to hass."""
         await super().async_added_to_hass()
         last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state not in (
-            None,
-            "unknown",
-            "unavailable",
-        ):
+        if last_state is not None and last_state.state not in INVALID_RESTORE_STATES:
             self._restored_value = last_state.state == "on"
             if last_state.attributes.get("last_update"):
                 try:
@@ -304,22 +301,9 @@ class HondaGeneratorAlertBinarySensor(
         return "mdi:alert" if state else "mdi:check-circle"
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        attrs: dict[str, Any] = {"code": self._alert_code.code}
-
-        if self.coordinator.last_update_success:
-            if self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = False
-        else:
-            if self._restored_last_update:
-                attrs["last_update"] = self._restored_last_update.isoformat()
-            elif self.coordinator.data and self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = True
-
-        return attrs
+        return self._last_update_attributes(code=self._alert_code.code)
 
 
 class ServiceDueBinarySensor(HondaGeneratorEntity, BinarySensorEntity):
@@ -334,6 +318,7 @@ class ServiceDueBinarySensor(HondaGeneratorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self._service_type = service_type
         service_def = get_service_definition(service_type)
+        self._service_def = service_def
         self._attr_unique_id = (
             f"{DOMAIN}-{coordinator.data.controller_name}_service_{service_type.value}"
         )
@@ -364,7 +349,6 @@ class ServiceDueBinarySensor(HondaGeneratorEntity, BinarySensorEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
         record = self.coordinator.get_service_record(self._service_type)
-        service_def = get_service_definition(self._service_type)
         model_services = get_model_services(self.coordinator.data.model)
         interval = model_services.get(self._service_type)
 
@@ -426,7 +410,7 @@ class ServiceDueBinarySensor(HondaGeneratorEntity, BinarySensorEntity):
 
         # Metadata
         attrs["service_type"] = self._service_type.value
-        if service_def.is_dealer_service:
+        if self._service_def.is_dealer_service:
             attrs["dealer_service"] = True
 
         return attrs
@@ -16,7 +16,6 @@
 
 from dataclasses import dataclass
 
-
 # Alert code to translation key mapping
 # Keys are used for HA translations under entity.sensor.*.state.*
 CODE_TRANSLATION_KEYS: dict[str, str] = {
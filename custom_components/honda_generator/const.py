@@ -25,6 +25,12 @@ DEFAULT_RECONNECT_AFTER_FAILURES = 3
 # Grace period at startup before showing offline defaults (seconds)
 DEFAULT_STARTUP_GRACE_PERIOD = 60
 
+# Minimum time between entity updates from the Push data stream (seconds)
+PUSH_UPDATE_COOLDOWN = 0.25
+
+# Restored entity states that carry no usable value
+INVALID_RESTORE_STATES = frozenset({None, "unknown", "unavailable"})
+
 # Number of stop command attempts before giving up
 DEFAULT_STOP_ATTEMPTS = 3
 
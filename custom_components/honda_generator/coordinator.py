@@ -14,10 +14,13 @@
 
 """Honda Generator integration using DataUpdateCoordinator."""
 
+import asyncio
 import logging
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from bleak.backends.device import BLEDevice
 from homeassistant.components import bluetooth
@@ -26,10 +29,15 @@ from homeassistant.const import (
     CONF_PASSWORD,
     CONF_SCAN_INTERVAL,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     API,
@@ -61,6 +69,7 @@ from .const import (
     DEFAULT_STARTUP_GRACE_PERIOD,
     DEFAULT_STOP_ATTEMPTS,
     DOMAIN,
+    PUSH_UPDATE_COOLDOWN,
 )
 from .services import OIL_CHANGE_BREAKIN_INTERVAL, ServiceType, get_model_services
 
@@ -69,6 +78,39 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_VERSION = 1
 STORAGE_KEY_PREFIX = "honda_generator"
 
+# Entity keys (the unique_id suffix after the controller name) whose entities
+# need a diagnostic category read. Warning/fault entities are matched by prefix.
+_ENTITY_KEY_TO_CATEGORY: dict[str, DiagnosticCategory] = {
+    "runtime_hours": DiagnosticCategory.RUNTIME_HOURS,
+    "output_current": DiagnosticCategory.CURRENT,
+    "output_power": DiagnosticCategory.POWER,
+    "eco_mode": DiagnosticCategory.ECO_MODE,
+    "eco_mode_switch": DiagnosticCategory.ECO_MODE,
+    "fuel_level": DiagnosticCategory.FUEL,
+    "fuel_remaining_time": DiagnosticCategory.FUEL,
+    "fuel_volume": DiagnosticCategory.FUEL,
+    "fuel_gauge_level": DiagnosticCategory.FUEL,
+}
+# Entity unique IDs are "{DOMAIN}-{controller_name}_{key}"; the controller name
+# can differ from the config entry's unique_id, so keys are matched as suffixes
+_UNIQUE_ID_PREFIX = f"{DOMAIN}-"
+_ENTITY_SUFFIX_TO_CATEGORY: tuple[tuple[str, DiagnosticCategory], ...] = tuple(
+    (f"_{key}", category) for key, category in _ENTITY_KEY_TO_CATEGORY.items()
+)
+_WARNING_FAULT_MARKERS = ("_warning_", "_fault_")
+
+_ALL_CATEGORIES: frozenset[DiagnosticCategory] = frozenset(DiagnosticCategory)
+
+
+def _classify_unique_id(unique_id: str) -> DiagnosticCategory | None:
+    """Return the diagnostic category an entity needs, or None if it needs none."""
+    for suffix, category in _ENTITY_SUFFIX_TO_CATEGORY:
+        if unique_id.endswith(suffix):
+            return category
+    if any(marker in unique_id for marker in _WARNING_FAULT_MARKERS):
+        return DiagnosticCategory.WARNINGS_FAULTS
+    return None
+
 
 @dataclass
 class HondaGeneratorData:
@@ -79,7 +121,7 @@ class HondaGeneratorData:
     model: str
     firmware_version: str
     devices: list[Device]
-    last_update: datetime | None = None
+    last_update: datetime | None = None  # UTC
 
 
 class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
@@ -110,6 +152,9 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
                 CONF_RECONNECT_AFTER_FAILURES, DEFAULT_RECONNECT_AFTER_FAILURES
             )
         )
+        # Background teardown of a connection dropped by a forced reconnect;
+        # awaited before connecting again so BLE sessions never overlap
+        self._disconnect_task: asyncio.Task[None] | None = None
         # Startup grace period - keep entities unavailable until this expires
         self._startup_time: float = time.monotonic()
         self._startup_grace_period: int = int(
@@ -118,7 +163,8 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
             )
         )
         self._has_connected_once: bool = False
-        self._grace_period_logged_expired: bool = False
+        # Set once the grace period has ended (by connecting or expiring)
+        self._grace_period_check_done: bool = False
         if self._startup_grace_period > 0:
             _LOGGER.debug(
                 "Startup grace period: %ds (entities unavailable until connected)",
@@ -148,6 +194,16 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
         # Track whether missing service records have been initialized this session
         self._services_initialized: bool = False
 
+        # DeviceInfo shared by all entities, rebuilt when the details it was
+        # built from (controller, model, serial, firmware) change
+        self._device_info: DeviceInfo | None = None
+        self._device_info_key: tuple[str, str, str, str] | None = None
+
+        # (device_type, device_id) -> Device index over data.devices, rebuilt
+        # whenever a new devices list is published
+        self._device_index: dict[tuple[DeviceType, int], Device] = {}
+        self._device_index_source: list[Device] | None = None
+
         # Detect architecture from config entry
         self._architecture = Architecture(
             config_entry.data.get(CONF_ARCHITECTURE, Architecture.POLL)
@@ -166,6 +222,48 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
             update_interval=update_interval,
         )
 
+        # Diagnostic categories with enabled entities, cached until the entity
+        # registry changes so polls don't rescan the registry every cycle
+        self._entity_registry = er.async_get(hass)
+        self._enabled_categories_cache: frozenset[DiagnosticCategory] | None = None
+        self._registry_entity_ids: set[str] = set()
+        # unique_id -> category (None if the entity needs no diagnostic read);
+        # unique IDs never change meaning, so this survives registry updates
+        self._uid_categories: dict[str, DiagnosticCategory | None] = {}
+        self._registry_unsub: Callable[[], None] | None = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_registry_updated,
+            event_filter=self._async_is_own_registry_event,
+        )
+
+        # Coalesce Push stream frames so listeners update at most once per
+        # cooldown instead of once per CAN frame
+        self._push_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PUSH_UPDATE_COOLDOWN,
+            immediate=True,
+            function=self._async_flush_push_update,
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel listeners and pending updates and shut down the coordinator."""
+        if self._registry_unsub is not None:
+            self._registry_unsub()
+            self._registry_unsub = None
+        self._push_debouncer.async_cancel()
+        await self._async_wait_for_disconnect()
+        await super().async_shutdown()
+
+    async def _async_wait_for_disconnect(self) -> None:
+        """Wait for a pending forced disconnect to finish."""
+        task, self._disconnect_task = self._disconnect_task, None
+        if task is None:
+            return
+        await asyncio.wait([task])
+        if not task.cancelled() and (err := task.exception()) is not None:
+            _LOGGER.debug("Forced disconnect failed: %s", err)
+
     @property
     def architecture(self) -> Architecture:
         """Return the communication architecture."""
@@ -176,6 +274,29 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
         """Return True if we've successfully connected at least once."""
         return self._has_connected_once
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information shared by all entities."""
+        data = self.data
+        key = (
+            data.controller_name,
+            data.model,
+            data.serial_number,
+            data.firmware_version,
+        )
+        if self._device_info is None or key != self._device_info_key:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, data.controller_name)},
+                connections={(dr.CONNECTION_BLUETOOTH, data.controller_name)},
+                name=f"{data.model} ({data.serial_number})",
+                manufacturer="Honda",
+                model=data.model,
+                serial_number=data.serial_number,
+                sw_version=data.firmware_version,
+            )
+            self._device_info_key = key
+        return self._device_info
+
     @property
     def stored_runtime_hours(self) -> int | None:
         """Return the stored runtime hours value.
@@ -198,7 +319,9 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
         showing default offline values. This preserves dashboard state while
         waiting for the generator to be discovered after a restart.
         """
-        if self._has_connected_once:
+        # Once ended (connected or expired) the grace period never resumes,
+        # so skip the clock read on every entity availability check
+        if self._has_connected_once or self._grace_period_check_done:
             return False
         if self._startup_grace_period <= 0:
             return False
@@ -250,6 +373,14 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
             data["timestamp"] = self._stored_runtime_hours_timestamp.isoformat()
         await self._store.async_save(data)
 
+    def _runtime_hours_save_needed(self, value: int) -> bool:
+        """Return True if saving this runtime hours value could change anything."""
+        return (
+            not self._services_initialized
+            or self._stored_runtime_hours is None
+            or value > self._stored_runtime_hours
+        )
+
     async def _async_save_runtime_hours(self, value: int) -> None:
         """Save runtime hours to persistent storage if validated."""
         now = datetime.now()
@@ -781,28 +912,55 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
         # Apply runtime hours floor and schedule save if increased
         self._apply_runtime_hours_bounds(self.data.devices)
         runtime_hours = state.get("runtime_hours")
-        if runtime_hours is not None:
+        if runtime_hours is not None and self._runtime_hours_save_needed(
+            int(runtime_hours)
+        ):
             self.hass.async_create_task(
                 self._async_save_runtime_hours(int(runtime_hours))
             )
 
         # Update timestamp
-        self.data.last_update = datetime.now()
+        self.data.last_update = dt_util.utcnow()
 
-        # Notify listeners of the update
-        self.async_set_updated_data(self.data)
+        # Notify listeners, coalescing bursts of frames
+        self._push_debouncer.async_schedule_call()
+
+    @callback
+    def _async_flush_push_update(self) -> None:
+        """Publish the latest Push stream state to listeners."""
+        if self.data is not None:
+            self.async_set_updated_data(self.data)
+
+    @callback
+    def _async_is_own_registry_event(self, event_data: Mapping[str, Any]) -> bool:
+        """Return True if a registry event concerns this config entry's entities.
 
-    def _get_enabled_diagnostic_categories(self) -> set[DiagnosticCategory]:
+        Removed entities are no longer in the registry, so they are matched
+        against the entity IDs seen during the last scan.
+        """
+        entity_id = event_data.get("entity_id")
+        if entity_id in self._registry_entity_ids:
+            return True
+        entry = self._entity_registry.async_get(entity_id)
+        return entry is not None and entry.config_entry_id == self.config_entry.entry_id
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Invalidate the cached diagnostic categories on registry changes."""
+        self._enabled_categories_cache = None
+
+    def _get_enabled_diagnostic_categories(self) -> frozenset[DiagnosticCategory]:
         """Determine which diagnostic categories have enabled entities.
 
         Checks the entity registry to see which entities are enabled,
         and returns the set of diagnostic categories that need to be read.
+        The result is cached until the entity registry is next updated.
         """
-        from homeassistant.helpers import entity_registry as er
+        if self._enabled_categories_cache is not None:
+            return self._enabled_categories_cache
 
-        registry = er.async_get(self.hass)
         entries = er.async_entries_for_config_entry(
-            registry, self.config_entry.entry_id
+            self._entity_registry, self.config_entry.entry_id
         )
 
         # First poll before entities exist - read everything
@@ -810,28 +968,36 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
             _LOGGER.debug(
                 "No entities registered yet, reading all diagnostic categories"
             )
-            return set(DiagnosticCategory)
+            return _ALL_CATEGORIES
 
+        self._registry_entity_ids = {entry.entity_id for entry in entries}
         enabled: set[DiagnosticCategory] = set()
         for entry in entries:
             if entry.disabled_by is not None:
                 continue
 
-            uid = entry.unique_id
-            if "_warning_" in uid or "_fault_" in uid:
-                enabled.add(DiagnosticCategory.WARNINGS_FAULTS)
-            elif "runtime_hours" in uid:
-                enabled.add(DiagnosticCategory.RUNTIME_HOURS)
-            elif "output_current" in uid:
-                enabled.add(DiagnosticCategory.CURRENT)
-            elif "output_power" in uid:
-                enabled.add(DiagnosticCategory.POWER)
-            elif "eco_mode" in uid:
-                enabled.add(DiagnosticCategory.ECO_MODE)
-            elif "fuel" in uid:
-                enabled.add(DiagnosticCategory.FUEL)
-
-        return enabled
+            unique_id = entry.unique_id
+            if unique_id in self._uid_categories:
+                category = self._uid_categories[unique_id]
+            elif not unique_id.startswith(_UNIQUE_ID_PREFIX):
+                # Can't tell what this entity reads; keep every category enabled
+                _LOGGER.debug(
+                    "Unrecognized entity unique ID %s, reading all diagnostic "
+                    "categories",
+                    unique_id,
+                )
+                enabled.update(_ALL_CATEGORIES)
+                break
+            else:
+                category = _classify_unique_id(unique_id)
+                self._uid_categories[unique_id] = category
+            if category is not None:
+                enabled.add(category)
+                if len(enabled) == len(_ALL_CATEGORIES):
+                    break
+
+        self._enabled_categories_cache = frozenset(enabled)
+        return self._enabled_categories_cache
 
     def _create_api(self, ble_device, pwd: str) -> GeneratorAPIProtocol:
         """Create an API instance for the configured architecture."""
@@ -859,6 +1025,9 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
         reauth flow. At most two unlock attempts are made per connect, well under
         the generator's wrong-attempt lockout threshold.
         """
+        # The old client may still be tearing down the same BLE address
+        await self._async_wait_for_disconnect()
+
         candidates = [self.pwd]
         if normalize_password(self.pwd) != DEFAULT_PASSWORD:
             candidates.append(DEFAULT_PASSWORD)
@@ -932,10 +1101,18 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
 
             # Apply runtime hours floor and save if increased
             self._apply_runtime_hours_bounds(devices)
-            for device in devices:
-                if device.device_type == DeviceType.RUNTIME_HOURS and device.state:
-                    await self._async_save_runtime_hours(int(device.state))
-                    break
+            runtime_device = next(
+                (
+                    device
+                    for device in devices
+                    if device.device_type == DeviceType.RUNTIME_HOURS
+                ),
+                None,
+            )
+            if runtime_device is not None and runtime_device.state:
+                runtime_hours = int(runtime_device.state)
+                if self._runtime_hours_save_needed(runtime_hours):
+                    await self._async_save_runtime_hours(runtime_hours)
 
             self._last_successful_data = HondaGeneratorData(
                 self.api.controller_name,
@@ -943,7 +1120,7 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
                 self._cached_model or "Unknown",
                 self._cached_firmware or "unknown",
                 devices,
-                last_update=datetime.now(),
+                last_update=dt_util.utcnow(),
             )
             # Reset failure counter on success and mark as connected
             self._consecutive_failures = 0
@@ -954,6 +1131,7 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
                     elapsed,
                 )
                 self._has_connected_once = True
+                self._grace_period_check_done = True
             return self._last_successful_data
 
         except APIAuthError as err:
@@ -1002,18 +1180,19 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
                     "Forcing reconnect after %d consecutive failures",
                     self._consecutive_failures,
                 )
-                await self.api.disconnect()
-                self.api = None
+                # Tear down the stale connection in the background so this
+                # refresh isn't held up by BLE disconnect latency; the next
+                # connect waits for it
+                api, self.api = self.api, None
+                self._disconnect_task = self.hass.async_create_background_task(
+                    api.disconnect(), f"{DOMAIN} forced disconnect"
+                )
                 self._consecutive_failures = 0
 
             # Check if startup grace period just expired - if so, notify entities
             # so they can transition from unavailable to showing defaults
-            if (
-                not self._has_connected_once
-                and not self._grace_period_logged_expired
-                and not self.in_startup_grace_period
-            ):
-                self._grace_period_logged_expired = True
+            if not self._grace_period_check_done and not self.in_startup_grace_period:
+                self._grace_period_check_done = True
                 _LOGGER.debug(
                     "Startup grace period expired after %ds, notifying entities",
                     self._startup_grace_period,
@@ -1037,11 +1216,11 @@ class HondaGeneratorCoordinator(DataUpdateCoordinator[HondaGeneratorData]):
         self, device_type: DeviceType, device_id: int
     ) -> Device | None:
         """Return device by device id."""
-        try:
-            return [
-                device
-                for device in self.data.devices
-                if device.device_type == device_type and device.device_id == device_id
-            ][0]
-        except IndexError:
-            return None
+        devices = self.data.devices
+        if devices is not self._device_index_source:
+            self._device_index = {
+                (device.device_type, device.device_id): device
+                for device in reversed(devices)
+            }
+            self._device_index_source = devices
+        return self._device_index.get((device_type, device_id))
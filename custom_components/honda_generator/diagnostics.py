@@ -16,32 +16,27 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+if TYPE_CHECKING:
+    from . import HondaGeneratorConfigEntry
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant, entry: HondaGeneratorConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    runtime_data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = runtime_data.coordinator
+    coordinator = entry.runtime_data.coordinator
 
     # Redact sensitive information
     redacted_data = dict(entry.data)
     if CONF_PASSWORD in redacted_data:
         redacted_data[CONF_PASSWORD] = "**REDACTED**"
     if CONF_ADDRESS in redacted_data:
-        # Partially redact MAC address (show first 3 octets only)
-        addr = redacted_data[CONF_ADDRESS]
-        if ":" in addr:
-            parts = addr.split(":")
-            redacted_data[CONF_ADDRESS] = f"{parts[0]}:{parts[1]}:{parts[2]}:XX:XX:XX"
+        redacted_data[CONF_ADDRESS] = _redact_address(redacted_data[CONF_ADDRESS])
 
     diagnostics_data: dict[str, Any] = {
         "config_entry": {
@@ -93,6 +88,13 @@ async def async_get_config_entry_diagnostics(
     return diagnostics_data
 
 
+def _redact_address(addr: str) -> str:
+    """Partially redact MAC address (show first 3 octets only)."""
+    if addr.count(":") >= 3:
+        return f"{addr.rsplit(':', 3)[0]}:XX:XX:XX"
+    return addr
+
+
 def _redact_serial(serial: str) -> str:
     """Redact serial number, keeping only first 4 characters."""
     if len(serial) > 4:
@@ -15,6 +15,11 @@
 """Base entity for Honda Generator integration."""
 
 import logging
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
 
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
@@ -49,47 +54,98 @@ class HondaGeneratorEntity(CoordinatorEntity[HondaGeneratorCoordinator]):
         (e.g., false_when_unavailable, zero_when_unavailable) must override
         this method to return True in those cases.
         """
+        coordinator = self.coordinator
         # Startup grace period - waiting for first connection
-        if self.coordinator.in_startup_grace_period:
+        if coordinator.in_startup_grace_period:
             return False
-        return super().available
+        # Same as CoordinatorEntity.available, without the extra lookups
+        return coordinator.last_update_success
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Update device registry if firmware version changed from unknown to a real value
         firmware = self.coordinator.data.firmware_version
-        if firmware != "unknown" and self._last_known_firmware != firmware:
+        if firmware != self._last_known_firmware and firmware != "unknown":
             self._last_known_firmware = firmware
             self._update_device_registry()
         super()._handle_coordinator_update()
 
     def _update_device_registry(self) -> None:
         """Update device registry with current data."""
+        data = self.coordinator.data
         device_registry = dr.async_get(self.hass)
         device_entry = device_registry.async_get_device(
-            identifiers={(DOMAIN, self.coordinator.data.controller_name)}
+            identifiers={(DOMAIN, data.controller_name)}
         )
         if device_entry:
             device_registry.async_update_device(
                 device_entry.id,
-                name=f"{self.coordinator.data.model} ({self.coordinator.data.serial_number})",
-                sw_version=self.coordinator.data.firmware_version,
-                model=self.coordinator.data.model,
-                serial_number=self.coordinator.data.serial_number,
+                name=f"{data.model} ({data.serial_number})",
+                sw_version=data.firmware_version,
+                model=data.model,
+                serial_number=data.serial_number,
             )
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.data.controller_name)},
-            connections={
-                (dr.CONNECTION_BLUETOOTH, self.coordinator.data.controller_name)
-            },
-            name=f"{self.coordinator.data.model} ({self.coordinator.data.serial_number})",
-            manufacturer="Honda",
-            model=self.coordinator.data.model,
-            serial_number=self.coordinator.data.serial_number,
-            sw_version=self.coordinator.data.firmware_version,
-        )
+        """Return device information (shared by all entities via the coordinator)."""
+        return self.coordinator.device_info
+
+
+def iso_timestamp(value: datetime) -> str:
+    """Format a timestamp, reusing the result across entities sharing it."""
+    # Equal instants with different offsets hash alike, so key on the offset too
+    return _format_iso(value, value.utcoffset())
+
+
+@lru_cache(maxsize=4)
+def _format_iso(value: datetime, offset: timedelta | None) -> str:
+    """Format a timestamp (cached helper for iso_timestamp)."""
+    return value.isoformat()
+
+
+class LastUpdateAttributesMixin:
+    """Provides cached last_update/data_stale attributes for persistent entities.
+
+    The attributes only change when the coordinator's success flag or
+    timestamps do, so the mapping is rebuilt only then.
+    """
+
+    coordinator: HondaGeneratorCoordinator
+    _restored_last_update: datetime | None
+    _attrs_key: tuple[Any, ...] | None = None
+    _attrs: Mapping[str, Any] = MappingProxyType({})
+
+    def _last_update_attributes(self, **extra: Any) -> Mapping[str, Any]:
+        """Return the last_update and data_stale attributes plus any extras."""
+        success = self.coordinator.last_update_success
+        data = self.coordinator.data
+        last_update = data.last_update if data else None
+        restored = self._restored_last_update
+        key = self._attrs_key
+        if (
+            key is not None
+            and key[0] is success
+            and key[1] is last_update
+            and key[2] is restored
+            and key[3] == extra
+        ):
+            return self._attrs
+
+        attrs: dict[str, Any] = {}
+        if success:
+            if last_update:
+                attrs["last_update"] = iso_timestamp(last_update)
+            attrs["data_stale"] = False
+        else:
+            if restored:
+                attrs["last_update"] = iso_timestamp(restored)
+            elif last_update:
+                attrs["last_update"] = iso_timestamp(last_update)
+            attrs["data_stale"] = True
+        attrs.update(extra)
+
+        self._attrs_key = (success, last_update, restored, extra)
+        self._attrs = MappingProxyType(attrs)
+        return self._attrs
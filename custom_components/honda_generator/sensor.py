@@ -17,8 +17,13 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import re
+import sys
+from abc import abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
@@ -47,8 +52,8 @@ from .api import (
     DeviceType,
     get_model_spec,
 )
-from .const import CONF_ARCHITECTURE, DOMAIN
-from .entity import HondaGeneratorEntity
+from .const import DOMAIN, INVALID_RESTORE_STATES
+from .entity import HondaGeneratorEntity, LastUpdateAttributesMixin
 
 if TYPE_CHECKING:
     from . import HondaGeneratorConfigEntry
@@ -56,6 +61,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Restored numeric sensor states (as written by str(float))
+_NUMERIC_RE = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
 
 @dataclass(frozen=True, kw_only=True)
 class HondaGeneratorSensorEntityDescription(SensorEntityDescription):
@@ -133,87 +141,47 @@ POLL_SENSOR_DESCRIPTIONS: tuple[HondaGeneratorSensorEntityDescription, ...] = (
     ),
 )
 
+_FUEL_LEVEL_DESCRIPTION = HondaGeneratorSensorEntityDescription(
+    key="fuel_level",
+    translation_key="fuel_level",
+    device_type=DeviceType.FUEL_LEVEL,
+    native_unit_of_measurement="%",
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+    icon="mdi:fuel",
+    persist_value=True,
+)
+
+_FUEL_REMAINING_TIME_DESCRIPTION = HondaGeneratorSensorEntityDescription(
+    key="fuel_remaining_time",
+    translation_key="fuel_remaining_time",
+    device_type=DeviceType.FUEL_REMAINING_TIME,
+    device_class=SensorDeviceClass.DURATION,
+    native_unit_of_measurement=UnitOfTime.MINUTES,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+    icon="mdi:timer-outline",
+)
+
 # Fuel sensors only available on models with fuel sensor support (e.g., EU7000is)
 FUEL_SENSOR_DESCRIPTIONS: tuple[HondaGeneratorSensorEntityDescription, ...] = (
-    HondaGeneratorSensorEntityDescription(
-        key="fuel_level",
-        translation_key="fuel_level",
-        device_type=DeviceType.FUEL_LEVEL,
-        native_unit_of_measurement="%",
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=0,
-        icon="mdi:fuel",
-        persist_value=True,
-    ),
-    HondaGeneratorSensorEntityDescription(
-        key="fuel_remaining_time",
-        translation_key="fuel_remaining_time",
-        device_type=DeviceType.FUEL_REMAINING_TIME,
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.MINUTES,
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=0,
-        icon="mdi:timer-outline",
-    ),
+    _FUEL_LEVEL_DESCRIPTION,
+    _FUEL_REMAINING_TIME_DESCRIPTION,
 )
 
-# Sensors for Push architecture (common sensors like runtime_hours, current, power, voltage)
-PUSH_SENSOR_DESCRIPTIONS: tuple[HondaGeneratorSensorEntityDescription, ...] = (
-    HondaGeneratorSensorEntityDescription(
-        key="runtime_hours",
-        translation_key="runtime_hours",
-        device_type=DeviceType.RUNTIME_HOURS,
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.HOURS,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        suggested_display_precision=0,
-        icon="mdi:timer",
-        persist_value=True,
-    ),
-    HondaGeneratorSensorEntityDescription(
-        key="output_current",
-        translation_key="output_current",
-        device_type=DeviceType.CURRENT,
-        device_class=SensorDeviceClass.CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=2,
-        zero_when_unavailable=True,
-    ),
-    HondaGeneratorSensorEntityDescription(
-        key="output_power",
-        translation_key="output_power",
-        device_type=DeviceType.POWER,
-        device_class=SensorDeviceClass.APPARENT_POWER,
-        native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=0,
-        zero_when_unavailable=True,
-    ),
-    HondaGeneratorSensorEntityDescription(
-        key="output_voltage",
-        translation_key="output_voltage",
-        device_type=DeviceType.OUTPUT_VOLTAGE,
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=0,
-        zero_when_unavailable=True,
-    ),
+# Sensors for Push architecture (common sensors like runtime_hours, current, power, voltage).
+# Same as Poll minus the enum sensors; the CAN stream reports current to 0.01 A.
+PUSH_SENSOR_DESCRIPTIONS: tuple[HondaGeneratorSensorEntityDescription, ...] = tuple(
+    replace(desc, suggested_display_precision=2)
+    if desc.key == "output_current"
+    else desc
+    for desc in POLL_SENSOR_DESCRIPTIONS
+    if desc.enum_keys is None
 )
 
 # EU3200i-specific sensors (Push architecture)
 EU3200I_SENSOR_DESCRIPTIONS: tuple[HondaGeneratorSensorEntityDescription, ...] = (
-    HondaGeneratorSensorEntityDescription(
-        key="fuel_level",
-        translation_key="fuel_level",
-        device_type=DeviceType.FUEL_LEVEL,
-        native_unit_of_measurement="%",
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=0,
-        icon="mdi:fuel",
-        persist_value=True,
-    ),
+    _FUEL_LEVEL_DESCRIPTION,
     HondaGeneratorSensorEntityDescription(
         key="fuel_volume",
         translation_key="fuel_volume",
@@ -233,16 +201,7 @@ EU3200I_SENSOR_DESCRIPTIONS: tuple[HondaGeneratorSensorEntityDescription, ...] =
         icon="mdi:gauge",
         persist_value=True,
     ),
-    HondaGeneratorSensorEntityDescription(
-        key="fuel_remaining_time",
-        translation_key="fuel_remaining_time",
-        device_type=DeviceType.FUEL_REMAINING_TIME,
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.MINUTES,
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=0,
-        icon="mdi:timer-outline",
-    ),
+    _FUEL_REMAINING_TIME_DESCRIPTION,
     HondaGeneratorSensorEntityDescription(
         key="output_voltage_setting",
         translation_key="output_voltage_setting",
@@ -264,48 +223,98 @@ async def async_setup_entry(
     """Set up the sensors."""
     coordinator = config_entry.runtime_data.coordinator
 
-    # Detect architecture from config entry
-    architecture = Architecture(
-        config_entry.data.get(CONF_ARCHITECTURE, Architecture.POLL)
-    )
+    # Architecture was already resolved from the config entry by the coordinator
+    architecture = coordinator.architecture
 
     def _create_sensor(
         desc: HondaGeneratorSensorEntityDescription,
     ) -> SensorEntity:
         """Create the appropriate sensor class based on description flags."""
-        if desc.persist_value and desc.state_class == SensorStateClass.TOTAL_INCREASING:
-            return HondaGeneratorPersistentSensor(coordinator, desc)
-        if desc.persist_value:
-            return HondaGeneratorPersistentMeasurementSensor(coordinator, desc)
-        if desc.enum_keys is not None:
-            return HondaGeneratorPersistentEnumSensor(coordinator, desc)
-        return HondaGeneratorSensor(coordinator, desc)
-
-    entities: list[SensorEntity] = []
-
-    if architecture == Architecture.PUSH:
-        # Push architecture (EU3200i): Use Push-specific sensor descriptions
-        for description in PUSH_SENSOR_DESCRIPTIONS:
-            entities.append(_create_sensor(description))
-
-        # Add EU3200i-specific sensors
-        for description in EU3200I_SENSOR_DESCRIPTIONS:
-            entities.append(_create_sensor(description))
+        key = (
+            desc.persist_value,
+            desc.state_class == SensorStateClass.TOTAL_INCREASING,
+            desc.enum_keys is not None,
+        )
+        return _SENSOR_CLASSES.get(key, HondaGeneratorSensor)(coordinator, desc)
+
+    descriptions: tuple[HondaGeneratorSensorEntityDescription, ...]
+    if architecture is Architecture.PUSH:
+        # Push architecture (EU3200i): Push-specific plus EU3200i-specific sensors
+        descriptions = PUSH_SENSOR_DESCRIPTIONS + EU3200I_SENSOR_DESCRIPTIONS
+    elif (
+        coordinator.api
+        and (model_spec := get_model_spec(coordinator.api.model))
+        and model_spec.fuel_sensor
+    ):
+        # Poll architecture with fuel sensor support
+        descriptions = POLL_SENSOR_DESCRIPTIONS + FUEL_SENSOR_DESCRIPTIONS
     else:
-        # Poll architecture: Use standard sensor descriptions
-        for description in POLL_SENSOR_DESCRIPTIONS:
-            entities.append(_create_sensor(description))
+        descriptions = POLL_SENSOR_DESCRIPTIONS
 
-        # Add fuel sensors only for models with fuel sensor support
-        if coordinator.api:
-            model_spec = get_model_spec(coordinator.api.model)
-            if model_spec and model_spec.fuel_sensor:
-                for description in FUEL_SENSOR_DESCRIPTIONS:
-                    entities.append(_create_sensor(description))
+    entities = [_create_sensor(description) for description in descriptions]
 
     async_add_entities(entities)
 
 
+@lru_cache(maxsize=256)
+def _unknown_key(value: int) -> str:
+    """Return the enum option for a value without a translation key."""
+    return sys.intern(f"unknown_{value}")
+
+
+def _enum_table(enum_keys: dict[int, str]) -> tuple[str | None, ...]:
+    """Expand an int -> translation key mapping into a tuple indexed by value."""
+    return tuple(
+        enum_keys.get(value) for value in range(max(enum_keys, default=-1) + 1)
+    )
+
+
+def _lookup_enum(table: tuple[str | None, ...], value: int) -> str:
+    """Return the translation key for an enum value."""
+    if 0 <= value < len(table) and (key := table[value]) is not None:
+        return key
+    return _unknown_key(value)
+
+
+@lru_cache(maxsize=4)
+def _from_iso(value: str) -> datetime:
+    """Parse a restored timestamp, reusing the result across sensors."""
+    return datetime.fromisoformat(value)
+
+
+def _restored_timestamp(attributes: Mapping[str, Any]) -> datetime | None:
+    """Return the last_update attribute of a restored state, if valid."""
+    if not (value := attributes.get("last_update")):
+        return None
+    try:
+        return _from_iso(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _unique_id(coordinator: HondaGeneratorCoordinator, key: str) -> str:
+    """Return the interned unique ID for a sensor of this generator."""
+    return sys.intern(f"{DOMAIN}-{coordinator.data.controller_name}_{key}")
+
+
+def _set_static_attrs(
+    entity: SensorEntity, description: HondaGeneratorSensorEntityDescription
+) -> None:
+    """Copy static description fields onto the entity's _attr_* attributes.
+
+    The description never changes, so state writes can read these directly
+    instead of falling back to entity_description each time.
+    """
+    entity._attr_device_class = description.device_class
+    entity._attr_native_unit_of_measurement = description.native_unit_of_measurement
+    entity._attr_state_class = description.state_class
+    entity._attr_entity_category = description.entity_category
+    entity._attr_icon = description.icon
+    entity._attr_translation_key = description.translation_key
+    entity._attr_options = description.options
+    entity._attr_suggested_display_precision = description.suggested_display_precision
+
+
 class HondaGeneratorSensor(HondaGeneratorEntity, SensorEntity):
     """Honda Generator sensor entity."""
 
@@ -319,20 +328,34 @@ class HondaGeneratorSensor(HondaGeneratorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = (
-            f"{DOMAIN}-{coordinator.data.controller_name}_{description.key}"
+        _set_static_attrs(self, description)
+        self._device_type = description.device_type
+        self._attr_unique_id = _unique_id(coordinator, description.key)
+        self._enum_table = (
+            _enum_table(description.enum_keys)
+            if description.enum_keys is not None
+            else None
         )
+        self._zero_when_unavailable = description.zero_when_unavailable
+        # (native_value, available) from the last state write
+        self._last_written: tuple[Any, bool] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
+        """Update sensor with latest data from coordinator.
+
+        Skips the state write when neither the value nor availability changed,
+        which is the common case for an idle generator.
+        """
+        written = (self.native_value, self.available)
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()
 
     def _get_device_state(self) -> int | float | None:
         """Get the current device state from coordinator."""
-        device = self.coordinator.get_device_by_id(
-            self.entity_description.device_type, 1
-        )
+        device = self.coordinator.get_device_by_id(self._device_type, 1)
         if device is None:
             return 0
         # None state means bounds check failed - sensor should be unavailable
@@ -343,27 +366,23 @@ class HondaGeneratorSensor(HondaGeneratorEntity, SensorEntity):
     @property
     def native_value(self) -> int | float | str | None:
         """Return the state of the sensor."""
+        # Common case: connected numeric sensor reports the device state as is
+        if self._enum_table is None and self.coordinator.last_update_success:
+            return self._get_device_state()
+
         state = self._get_device_state()
         # None state (bounds check failure) always returns None for unavailable
         if state is None:
             return None
 
+        # Offline sensors with zero_when_unavailable report 0
+        if not self.coordinator.last_update_success and self._zero_when_unavailable:
+            state = 0
+
         # For enum sensors, convert int state to translation key string
-        if self.entity_description.enum_keys is not None:
-            if self.coordinator.last_update_success:
-                int_state = int(state)
-            elif self.entity_description.zero_when_unavailable:
-                int_state = 0
-            else:
-                int_state = int(state)
-            return self.entity_description.enum_keys.get(
-                int_state, f"unknown_{int_state}"
-            )
+        if self._enum_table is not None:
+            return _lookup_enum(self._enum_table, int(state))
 
-        if self.coordinator.last_update_success:
-            return state
-        if self.entity_description.zero_when_unavailable:
-            return 0
         return state
 
     @property
@@ -373,35 +392,31 @@ class HondaGeneratorSensor(HondaGeneratorEntity, SensorEntity):
         Sensors with zero_when_unavailable stay available to show offline
         defaults (0) when not connected. Other sensors become unavailable.
         """
+        coordinator = self.coordinator
         # Startup grace period - show unavailable while waiting for first connection
-        if self.coordinator.in_startup_grace_period:
+        if coordinator.in_startup_grace_period:
             return False
+        last_update_success = coordinator.last_update_success
         # Sensors with zero_when_unavailable stay available to show offline default
-        if self.entity_description.zero_when_unavailable:
+        if self._zero_when_unavailable:
             # But still unavailable if bounds check failed while connected
-            if (
-                self.coordinator.last_update_success
-                and self._get_device_state() is None
-            ):
-                return False
-            return True
-        # If state is None (bounds check failed), sensor is unavailable
-        if self._get_device_state() is None:
-            return False
-        # Regular sensors follow coordinator availability
-        return super().available
+            return not (last_update_success and self._get_device_state() is None)
+        # If state is None (bounds check failed), sensor is unavailable,
+        # otherwise regular sensors follow coordinator availability
+        return last_update_success and self._get_device_state() is not None
 
 
-class HondaGeneratorPersistentSensor(HondaGeneratorEntity, RestoreEntity, SensorEntity):
-    """Honda Generator sensor that persists its last value when unavailable.
+class _HondaGeneratorRestoringSensor(
+    LastUpdateAttributesMixin, HondaGeneratorEntity, RestoreEntity, SensorEntity
+):
+    """Shared setup and state restoration for the persistent sensors.
 
-    For TOTAL_INCREASING sensors like runtime_hours, the restored value is only
-    used after we've attempted to connect and failed. This prevents showing stale
-    restored values immediately on HA restart before we've confirmed the current
-    value, which would cause incorrect spikes in history graphs.
+    Subclasses decide how a restored state string is decoded and what is
+    shown while the generator is offline.
     """
 
     entity_description: HondaGeneratorSensorEntityDescription
+    _restored_value: int | float | str | None
 
     def __init__(
         self,
@@ -411,36 +426,88 @@ class HondaGeneratorPersistentSensor(HondaGeneratorEntity, RestoreEntity, Sensor
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = (
-            f"{DOMAIN}-{coordinator.data.controller_name}_{description.key}"
-        )
-        self._restored_value: int | float | None = None
+        _set_static_attrs(self, description)
+        self._device_type = description.device_type
+        self._attr_unique_id = _unique_id(coordinator, description.key)
+        self._restored_value = None
         self._restored_last_update: datetime | None = None
-        self._restoration_complete = False
         self._first_update_attempted = False
+        # (native_value, available, attributes) from the last state write
+        self._last_written: tuple[Any, bool, Mapping[str, Any]] | None = None
+
+    def _decode_restored(self, state: str) -> int | float | str | None:
+        """Return the value for a restored state string, or None to ignore it."""
+        # Numeric check excludes unknown/unavailable without a float() failure
+        if not _NUMERIC_RE.fullmatch(state):
+            return None
+        # Keep whole-number states (e.g. runtime hours) as ints
+        try:
+            return int(state)
+        except ValueError:
+            return float(state)
 
     async def async_added_to_hass(self) -> None:
         """Restore last state when added to hass."""
         await super().async_added_to_hass()
         last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state not in (
-            None,
-            "unknown",
-            "unavailable",
-        ):
-            try:
-                self._restored_value = float(last_state.state)
-                _LOGGER.debug(
-                    "Restored %s value: %s",
-                    self.entity_description.key,
-                    self._restored_value,
-                )
-                if last_state.attributes.get("last_update"):
-                    self._restored_last_update = datetime.fromisoformat(
-                        last_state.attributes["last_update"]
-                    )
-            except (ValueError, TypeError):
-                self._restored_value = None
+        if last_state is None:
+            return
+        value = self._decode_restored(last_state.state)
+        if value is not None:
+            self._restored_value = value
+            _LOGGER.debug(
+                "Restored %s value: %s",
+                self.entity_description.key,
+                self._restored_value,
+            )
+            self._restored_last_update = _restored_timestamp(last_state.attributes)
+
+    def _write_state_if_changed(self) -> None:
+        """Write state unless value, availability and attributes are unchanged.
+
+        Repeated failed polls while the generator is off leave all three
+        alone, so those writes are skipped.
+        """
+        written = (self.native_value, self.available, self.extra_state_attributes)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
+
+    def _clear_restored(self) -> None:
+        """Drop the restored value once live data is authoritative."""
+        self._restored_value = None
+        self._restored_last_update = None
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return extra state attributes."""
+        return self._last_update_attributes()
+
+
+class HondaGeneratorPersistentSensor(_HondaGeneratorRestoringSensor):
+    """Honda Generator sensor that persists its last value when unavailable.
+
+    For TOTAL_INCREASING sensors like runtime_hours, the restored value is only
+    used after we've attempted to connect and failed. This prevents showing stale
+    restored values immediately on HA restart before we've confirmed the current
+    value, which would cause incorrect spikes in history graphs.
+    """
+
+    _restored_value: int | float | None
+
+    def __init__(
+        self,
+        coordinator: HondaGeneratorCoordinator,
+        description: HondaGeneratorSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description)
+        self._restoration_complete = False
+
+    async def async_added_to_hass(self) -> None:
+        """Restore last state when added to hass."""
+        await super().async_added_to_hass()
         self._restoration_complete = True
 
     @callback
@@ -466,16 +533,13 @@ class HondaGeneratorPersistentSensor(HondaGeneratorEntity, RestoreEntity, Sensor
                     self._restored_value,
                     live_value,
                 )
-                self._restored_value = None
-                self._restored_last_update = None
+                self._clear_restored()
 
-        self.async_write_ha_state()
+        self._write_state_if_changed()
 
     def _get_device_state(self) -> int | float | None:
         """Get the current device state from coordinator."""
-        device = self.coordinator.get_device_by_id(
-            self.entity_description.device_type, 1
-        )
+        device = self.coordinator.get_device_by_id(self._device_type, 1)
         return device.state if device else None
 
     @property
@@ -541,80 +605,36 @@ class HondaGeneratorPersistentSensor(HondaGeneratorEntity, RestoreEntity, Sensor
         return self._get_device_state() is not None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        attrs: dict[str, Any] = {}
-
-        if self.coordinator.last_update_success:
-            if self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = False
-        else:
-            if self._restored_last_update:
-                attrs["last_update"] = self._restored_last_update.isoformat()
-            elif self.coordinator.data and self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = True
-
         # Usage rate attribute on runtime hours sensor
-        if self.entity_description.device_type == DeviceType.RUNTIME_HOURS:
+        if self._device_type is DeviceType.RUNTIME_HOURS:
             rate = self.coordinator.get_hours_per_day()
-            attrs["usage_rate_hours_per_day"] = (
-                round(rate, 2) if rate is not None else None
+            return self._last_update_attributes(
+                usage_rate_hours_per_day=round(rate, 2) if rate is not None else None
             )
+        return self._last_update_attributes()
 
-        return attrs
 
+class _HondaGeneratorLastValueSensor(_HondaGeneratorRestoringSensor):
+    """Persistent sensor that shows its last live value while offline.
 
-class HondaGeneratorPersistentEnumSensor(
-    HondaGeneratorEntity, RestoreEntity, SensorEntity
-):
-    """Honda Generator enum sensor that persists its last value when unavailable.
-
-    For enum sensors like engine_event and engine_error, the last known value
-    is preserved when the generator goes offline so alarm states remain visible.
+    Subclasses implement _live_value(); the last non-None result is kept and
+    preferred over the restored value once the generator goes offline.
     """
 
-    entity_description: HondaGeneratorSensorEntityDescription
-
     def __init__(
         self,
         coordinator: HondaGeneratorCoordinator,
         description: HondaGeneratorSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = (
-            f"{DOMAIN}-{coordinator.data.controller_name}_{description.key}"
-        )
-        self._restored_value: str | None = None
-        self._restored_last_update: datetime | None = None
-        self._last_live_value: str | None = None
-        self._first_update_attempted = False
+        super().__init__(coordinator, description)
+        self._last_live_value: int | float | str | None = None
 
-    async def async_added_to_hass(self) -> None:
-        """Restore last state when added to hass."""
-        await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state not in (
-            None,
-            "unknown",
-            "unavailable",
-        ):
-            self._restored_value = last_state.state
-            _LOGGER.debug(
-                "Restored %s value: %s",
-                self.entity_description.key,
-                self._restored_value,
-            )
-            if last_state.attributes.get("last_update"):
-                try:
-                    self._restored_last_update = datetime.fromisoformat(
-                        last_state.attributes["last_update"]
-                    )
-                except (ValueError, TypeError):
-                    self._restored_last_update = None
+    @abstractmethod
+    def _live_value(self) -> int | float | str | None:
+        """Return the current value from live data."""
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -622,49 +642,25 @@ class HondaGeneratorPersistentEnumSensor(
         if not self._first_update_attempted:
             self._first_update_attempted = True
 
-        # When we get live data, save the enum value and clear restored value
+        # When we get live data, save it and clear restored value
         if self.coordinator.last_update_success:
-            live_value = self._get_live_enum_value()
+            live_value = self._live_value()
             if live_value is not None:
                 self._last_live_value = live_value
             if self._restored_value is not None:
-                self._restored_value = None
-                self._restored_last_update = None
+                self._clear_restored()
 
-        self.async_write_ha_state()
-
-    def _get_device_state(self) -> int | float | None:
-        """Get the current device state from coordinator."""
-        device = self.coordinator.get_device_by_id(
-            self.entity_description.device_type, 1
-        )
-        if device is None:
-            return 0
-        if device.state is None:
-            return None
-        return device.state
-
-    def _get_live_enum_value(self) -> str | None:
-        """Get the current enum string value from live data."""
-        state = self._get_device_state()
-        if state is None:
-            return None
-        if self.entity_description.enum_keys is not None:
-            int_state = int(state)
-            return self.entity_description.enum_keys.get(
-                int_state, f"unknown_{int_state}"
-            )
-        return None
+        self._write_state_if_changed()
 
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> int | float | str | None:
         """Return the state of the sensor.
 
         When connected, use live data. When offline, persist the last known
-        enum value so alarm states remain visible.
+        value.
         """
         if self.coordinator.last_update_success:
-            return self._get_live_enum_value()
+            return self._live_value()
 
         # Don't use persisted value until we've tried to get fresh data
         if not self._first_update_attempted:
@@ -673,9 +669,7 @@ class HondaGeneratorPersistentEnumSensor(
         # Use best available offline value
         if self._last_live_value is not None:
             return self._last_live_value
-        if self._restored_value is not None:
-            return self._restored_value
-        return None
+        return self._restored_value
 
     @property
     def available(self) -> bool:
@@ -688,161 +682,74 @@ class HondaGeneratorPersistentEnumSensor(
         # After first update attempt, available if we have persisted data
         if not self._first_update_attempted:
             return False
-        if self._last_live_value is not None:
-            return True
-        if self._restored_value is not None:
-            return True
-        return False
+        return self._last_live_value is not None or self._restored_value is not None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes for persistent enum sensor."""
-        attrs: dict[str, Any] = {}
-
-        if self.coordinator.last_update_success:
-            if self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = False
-        else:
-            if self._restored_last_update:
-                attrs["last_update"] = self._restored_last_update.isoformat()
-            elif self.coordinator.data and self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = True
 
-        return attrs
-
-
-class HondaGeneratorPersistentMeasurementSensor(
-    HondaGeneratorEntity, RestoreEntity, SensorEntity
-):
-    """Honda Generator measurement sensor that persists its last value when unavailable.
+class HondaGeneratorPersistentEnumSensor(_HondaGeneratorLastValueSensor):
+    """Honda Generator enum sensor that persists its last value when unavailable.
 
-    For measurement sensors like fuel level and voltage setting, the last known
-    value is preserved when the generator goes offline.
+    For enum sensors like engine_event and engine_error, the last known value
+    is preserved when the generator goes offline so alarm states remain visible.
     """
 
-    entity_description: HondaGeneratorSensorEntityDescription
-
     def __init__(
         self,
         coordinator: HondaGeneratorCoordinator,
         description: HondaGeneratorSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = (
-            f"{DOMAIN}-{coordinator.data.controller_name}_{description.key}"
+        super().__init__(coordinator, description)
+        self._enum_table = (
+            _enum_table(description.enum_keys)
+            if description.enum_keys is not None
+            else None
         )
-        self._restored_value: int | float | None = None
-        self._restored_last_update: datetime | None = None
-        self._last_live_value: int | float | None = None
-        self._first_update_attempted = False
-
-    async def async_added_to_hass(self) -> None:
-        """Restore last state when added to hass."""
-        await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state not in (
-            None,
-            "unknown",
-            "unavailable",
-        ):
-            try:
-                self._restored_value = float(last_state.state)
-                _LOGGER.debug(
-                    "Restored %s value: %s",
-                    self.entity_description.key,
-                    self._restored_value,
-                )
-                if last_state.attributes.get("last_update"):
-                    self._restored_last_update = datetime.fromisoformat(
-                        last_state.attributes["last_update"]
-                    )
-            except (ValueError, TypeError):
-                self._restored_value = None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        if not self._first_update_attempted:
-            self._first_update_attempted = True
-
-        # When we get live data, save it and clear restored value
-        if self.coordinator.last_update_success:
-            live_value = self._get_device_state()
-            if live_value is not None:
-                self._last_live_value = live_value
-            if self._restored_value is not None:
-                self._restored_value = None
-                self._restored_last_update = None
 
-        self.async_write_ha_state()
+    def _decode_restored(self, state: str) -> str | None:
+        """Return the restored enum option, ignoring unknown/unavailable."""
+        return state if state not in INVALID_RESTORE_STATES else None
 
     def _get_device_state(self) -> int | float | None:
         """Get the current device state from coordinator."""
-        device = self.coordinator.get_device_by_id(
-            self.entity_description.device_type, 1
-        )
+        device = self.coordinator.get_device_by_id(self._device_type, 1)
         if device is None:
-            return None
+            return 0
         if device.state is None:
             return None
         return device.state
 
-    @property
-    def native_value(self) -> int | float | None:
-        """Return the state of the sensor.
+    def _live_value(self) -> str | None:
+        """Get the current enum string value from live data."""
+        state = self._get_device_state()
+        if state is None:
+            return None
+        if self._enum_table is not None:
+            return _lookup_enum(self._enum_table, int(state))
+        return None
 
-        When connected, use live data. When offline, persist the last known
-        measurement value.
-        """
-        if self.coordinator.last_update_success:
-            return self._get_device_state()
 
-        # Don't use persisted value until we've tried to get fresh data
-        if not self._first_update_attempted:
-            return None
+class HondaGeneratorPersistentMeasurementSensor(_HondaGeneratorLastValueSensor):
+    """Honda Generator measurement sensor that persists its last value when unavailable.
 
-        # Use best available offline value
-        if self._last_live_value is not None:
-            return self._last_live_value
-        if self._restored_value is not None:
-            return self._restored_value
-        return None
+    For measurement sensors like fuel level and voltage setting, the last known
+    value is preserved when the generator goes offline.
+    """
 
-    @property
-    def available(self) -> bool:
-        """Return True if we have any data (live or persisted)."""
-        # Startup grace period - show unavailable while waiting for first connection
-        if self.coordinator.in_startup_grace_period:
-            return False
-        if self.coordinator.last_update_success:
-            return True
-        # After first update attempt, available if we have persisted data
-        if not self._first_update_attempted:
-            return False
-        if self._last_live_value is not None:
-            return True
-        if self._restored_value is not None:
-            return True
-        return False
+    def _live_value(self) -> int | float | None:
+        """Get the current device state from coordinator."""
+        device = self.coordinator.get_device_by_id(self._device_type, 1)
+        if device is None:
+            return None
+        return device.state
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes for persistent measurement sensor."""
-        attrs: dict[str, Any] = {}
 
-        if self.coordinator.last_update_success:
-            if self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = False
-        else:
-            if self._restored_last_update:
-                attrs["last_update"] = self._restored_last_update.isoformat()
-            elif self.coordinator.data and self.coordinator.data.last_update:
-                attrs["last_update"] = self.coordinator.data.last_update.isoformat()
-            attrs["data_stale"] = True
-
-        return attrs
+# Sensor class by (persist_value, total_increasing, has enum_keys); anything
+# not listed is a plain HondaGeneratorSensor
+_SENSOR_CLASSES: dict[tuple[bool, bool, bool], type[SensorEntity]] = {
+    (True, True, False): HondaGeneratorPersistentSensor,
+    (True, True, True): HondaGeneratorPersistentSensor,
+    (True, False, False): HondaGeneratorPersistentMeasurementSensor,
+    (True, False, True): HondaGeneratorPersistentMeasurementSensor,
+    (False, False, True): HondaGeneratorPersistentEnumSensor,
+    (False, True, True): HondaGeneratorPersistentEnumSensor,
+}
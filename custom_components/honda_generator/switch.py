@@ -95,36 +95,27 @@ class EcoModeSwitch(HondaGeneratorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on ECO mode."""
-        if self.coordinator.api is None:
-            _LOGGER.error("Cannot enable ECO mode: not connected")
-            return
-        _LOGGER.info("Enabling ECO mode")
-        self._pending_state = True
-        self.async_write_ha_state()
-        success = await self.coordinator.api.set_eco_mode(True)
-        if success:
-            _LOGGER.info("ECO mode enable command sent successfully")
-            # Trigger a refresh to confirm the state change
-            await self.coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to enable ECO mode")
-            self._pending_state = None
-            self.async_write_ha_state()
+        await self._async_set_eco_mode(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off ECO mode."""
+        await self._async_set_eco_mode(False)
+
+    async def _async_set_eco_mode(self, enabled: bool) -> None:
+        """Send the ECO mode command, showing the new state until confirmed."""
+        action = "enable" if enabled else "disable"
         if self.coordinator.api is None:
-            _LOGGER.error("Cannot disable ECO mode: not connected")
+            _LOGGER.error("Cannot %s ECO mode: not connected", action)
             return
-        _LOGGER.info("Disabling ECO mode")
-        self._pending_state = False
+        _LOGGER.info("%s ECO mode", "Enabling" if enabled else "Disabling")
+        self._pending_state = enabled
         self.async_write_ha_state()
-        success = await self.coordinator.api.set_eco_mode(False)
+        success = await self.coordinator.api.set_eco_mode(enabled)
         if success:
-            _LOGGER.info("ECO mode disable command sent successfully")
+            _LOGGER.info("ECO mode %s command sent successfully", action)
             # Trigger a refresh to confirm the state change
             await self.coordinator.async_request_refresh()
         else:
-            _LOGGER.error("Failed to disable ECO mode")
+            _LOGGER.error("Failed to %s ECO mode", action)
             self._pending_state = None
             self.async_write_ha_state()
@@ -15,6 +15,7 @@ Examples:
 
 import sys
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 
@@ -40,6 +41,9 @@ class _MockDataUpdateCoordinator:
     def async_set_updated_data(self, data):
         pass
 
+    async def async_shutdown(self):
+        pass
+
 
 class _MockCoordinatorEntity:
     """Mock base class for CoordinatorEntity (supports inheritance)."""
@@ -149,6 +153,10 @@ class _MockStore:
 
 def setup_mocks():
     """Set up all required mocks before any other imports."""
+    # Already installed (e.g. runner re-entered in the same process)
+    if isinstance(sys.modules.get("homeassistant"), MagicMock):
+        return
+
     # Mock bleak
     _mock_bleak = MagicMock()
     _mock_bleak.BleakClient = MagicMock
@@ -160,15 +168,8 @@ def setup_mocks():
     _mock_bleak.backends.device = MagicMock()
     _mock_bleak.backends.device.BLEDevice = MagicMock
 
-    sys.modules["bleak"] = _mock_bleak
-    sys.modules["bleak.exc"] = _mock_bleak.exc
-    sys.modules["bleak.backends"] = _mock_bleak.backends
-    sys.modules["bleak.backends.characteristic"] = _mock_bleak.backends.characteristic
-    sys.modules["bleak.backends.device"] = _mock_bleak.backends.device
-
     _mock_bleak_retry = MagicMock()
     _mock_bleak_retry.establish_connection = AsyncMock()
-    sys.modules["bleak_retry_connector"] = _mock_bleak_retry
 
     # Mock homeassistant
     CONF_ADDRESS = "address"
@@ -225,46 +226,57 @@ def setup_mocks():
         "ConfigEntryAuthFailed", (Exception,), {}
     )
 
-    sys.modules["homeassistant"] = _mock_ha
-    sys.modules["homeassistant.config_entries"] = _mock_ha.config_entries
-    sys.modules["homeassistant.const"] = _mock_ha.const
-    sys.modules["homeassistant.core"] = _mock_ha.core
-    sys.modules["homeassistant.helpers"] = _mock_ha.helpers
-    sys.modules["homeassistant.helpers.device_registry"] = (
-        _mock_ha.helpers.device_registry
-    )
-    sys.modules["homeassistant.helpers.update_coordinator"] = (
-        _mock_ha.helpers.update_coordinator
-    )
-    sys.modules["homeassistant.helpers.entity_platform"] = (
-        _mock_ha.helpers.entity_platform
-    )
-    sys.modules["homeassistant.helpers.restore_state"] = _mock_ha.helpers.restore_state
     _mock_ha.helpers.storage = MagicMock()
     _mock_ha.helpers.storage.Store = _MockStore
-    sys.modules["homeassistant.helpers.storage"] = _mock_ha.helpers.storage
-    sys.modules["homeassistant.components"] = _mock_ha.components
-    sys.modules["homeassistant.components.sensor"] = _mock_ha.components.sensor
-    sys.modules["homeassistant.components.binary_sensor"] = (
-        _mock_ha.components.binary_sensor
-    )
-    sys.modules["homeassistant.components.button"] = _mock_ha.components.button
-    sys.modules["homeassistant.components.switch"] = _mock_ha.components.switch
-    sys.modules["homeassistant.exceptions"] = _mock_ha.exceptions
 
     # Mock homeassistant.helpers.config_validation (imported by __init__.py)
     _mock_ha.helpers.config_validation = MagicMock()
     _mock_ha.helpers.config_validation.config_entry_only_config_schema = MagicMock(
         return_value=MagicMock()
     )
-    sys.modules["homeassistant.helpers.config_validation"] = (
-        _mock_ha.helpers.config_validation
-    )
+
+    # Mock homeassistant.helpers.debounce (imported by coordinator.py)
+    _mock_ha.helpers.debounce = MagicMock()
 
     # Mock homeassistant.helpers.entity_registry (imported by coordinator.py)
     _mock_ha.helpers.entity_registry = MagicMock()
-    sys.modules["homeassistant.helpers.entity_registry"] = (
-        _mock_ha.helpers.entity_registry
+
+    # Mock homeassistant.util.dt (imported by coordinator.py) with a real clock
+    _mock_ha.util = MagicMock()
+    _mock_ha.util.dt = MagicMock()
+    _mock_ha.util.dt.utcnow = lambda: datetime.now(UTC)
+
+    # Register every mocked module in one place
+    sys.modules.update(
+        {
+            "bleak": _mock_bleak,
+            "bleak.exc": _mock_bleak.exc,
+            "bleak.backends": _mock_bleak.backends,
+            "bleak.backends.characteristic": _mock_bleak.backends.characteristic,
+            "bleak.backends.device": _mock_bleak.backends.device,
+            "bleak_retry_connector": _mock_bleak_retry,
+            "homeassistant": _mock_ha,
+            "homeassistant.config_entries": _mock_ha.config_entries,
+            "homeassistant.const": _mock_ha.const,
+            "homeassistant.core": _mock_ha.core,
+            "homeassistant.helpers": _mock_ha.helpers,
+            "homeassistant.helpers.device_registry": _mock_ha.helpers.device_registry,
+            "homeassistant.helpers.update_coordinator": _mock_ha.helpers.update_coordinator,
+            "homeassistant.helpers.entity_platform": _mock_ha.helpers.entity_platform,
+            "homeassistant.helpers.restore_state": _mock_ha.helpers.restore_state,
+            "homeassistant.helpers.storage": _mock_ha.helpers.storage,
+            "homeassistant.components": _mock_ha.components,
+            "homeassistant.components.sensor": _mock_ha.components.sensor,
+            "homeassistant.components.binary_sensor": _mock_ha.components.binary_sensor,
+            "homeassistant.components.button": _mock_ha.components.button,
+            "homeassistant.components.switch": _mock_ha.components.switch,
+            "homeassistant.exceptions": _mock_ha.exceptions,
+            "homeassistant.helpers.config_validation": _mock_ha.helpers.config_validation,
+            "homeassistant.helpers.debounce": _mock_ha.helpers.debounce,
+            "homeassistant.helpers.entity_registry": _mock_ha.helpers.entity_registry,
+            "homeassistant.util": _mock_ha.util,
+            "homeassistant.util.dt": _mock_ha.util.dt,
+        }
     )
 
 
@@ -1,12 +1,13 @@
 """Fixtures for Honda Generator tests.
 
-Note: This file expects mocks to be set up BEFORE importing.
-Use run_tests.py to run tests with proper mock setup.
+Note: This file expects mocks to be set up BEFORE importing. The root
+conftest.py installs them, so run the suite with plain ``pytest`` or
+``python3 run_tests.py``.
 """
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -44,37 +45,43 @@ TEST_EU3200I_SERIAL = "EBKJ-1234567"
 TEST_EU3200I_MODEL = "EU3200i"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ble_device() -> MagicMock:
-    """Create a mock BLE device."""
+    """Create a mock BLE device (shared; tests only read address and name)."""
     device = MagicMock()
     device.address = TEST_ADDRESS
     device.name = "EAMT"  # BLE advertised name is just the 4-letter serial prefix
     return device
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_eu3200i_ble_device() -> MagicMock:
-    """Create a mock BLE device for EU3200i."""
+    """Create a mock BLE device for EU3200i (shared like mock_ble_device)."""
     device = MagicMock()
     device.address = TEST_ADDRESS
     device.name = "EBKJ"  # BLE advertised name is just the 4-letter serial prefix
     return device
 
 
+def _create_mock_client() -> AsyncMock:
+    """Create a connected mock BleakClient.
+
+    Child attributes of an AsyncMock are AsyncMocks themselves, so the GATT
+    methods are only built when a test actually touches them.
+    """
+    mock_client = AsyncMock()
+    mock_client.is_connected = True
+    mock_client.read_gatt_char.return_value = b"\x01\x00\x00\x00"
+    return mock_client
+
+
 @pytest.fixture
 def mock_bleak_client() -> Generator[MagicMock, None, None]:
     """Mock the BleakClient."""
     with patch(
         "custom_components.honda_generator.api.BleakClient"
     ) as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.is_connected = True
-        mock_client.disconnect = AsyncMock()
-        mock_client.start_notify = AsyncMock()
-        mock_client.stop_notify = AsyncMock()
-        mock_client.write_gatt_char = AsyncMock()
-        mock_client.read_gatt_char = AsyncMock(return_value=b"\x01\x00\x00\x00")
+        mock_client = _create_mock_client()
         mock_client_class.return_value = mock_client
         yield mock_client
 
@@ -85,14 +92,7 @@ def mock_establish_connection() -> Generator[AsyncMock, None, None]:
     with patch(
         "custom_components.honda_generator.api.establish_connection"
     ) as mock_establish:
-        mock_client = AsyncMock()
-        mock_client.is_connected = True
-        mock_client.disconnect = AsyncMock()
-        mock_client.start_notify = AsyncMock()
-        mock_client.stop_notify = AsyncMock()
-        mock_client.write_gatt_char = AsyncMock()
-        mock_client.read_gatt_char = AsyncMock(return_value=b"\x01\x00\x00\x00")
-        mock_establish.return_value = mock_client
+        mock_establish.return_value = _create_mock_client()
         yield mock_establish
 
 
@@ -120,6 +120,25 @@ def mock_push_api(mock_eu3200i_ble_device: MagicMock) -> PushAPI:
     return api
 
 
+def _build_devices(
+    controller_name: str,
+    device_types: Iterable[DeviceType],
+    device_values: dict[DeviceType, int | float | bool],
+) -> list[Device]:
+    """Build one Device per type, defaulting unlisted states to 0."""
+    names = DEVICE_NAMES
+    return [
+        Device(
+            device_id=1,
+            device_unique_id=f"{controller_name}_{device_type}",
+            device_type=device_type,
+            name=names[device_type],
+            state=device_values.get(device_type, 0),
+        )
+        for device_type in device_types
+    ]
+
+
 def create_mock_devices(
     controller_name: str = TEST_ADDRESS,
     runtime_hours: float = 123.4,
@@ -143,18 +162,7 @@ def create_mock_devices(
         DeviceType.OUTPUT_VOLTAGE: output_voltage,
     }
 
-    devices = []
-    for device_type in DEVICE_TYPES:
-        devices.append(
-            Device(
-                device_id=1,
-                device_unique_id=f"{controller_name}_{device_type}",
-                device_type=device_type,
-                name=DEVICE_NAMES[device_type],
-                state=device_values.get(device_type, 0),
-            )
-        )
-    return devices
+    return _build_devices(controller_name, DEVICE_TYPES, device_values)
 
 
 def create_mock_push_devices(
@@ -186,18 +194,7 @@ def create_mock_push_devices(
         DeviceType.OUTPUT_VOLTAGE_SETTING: voltage_setting,
     }
 
-    devices = []
-    for device_type in DEVICE_TYPES_PUSH:
-        devices.append(
-            Device(
-                device_id=1,
-                device_unique_id=f"{controller_name}_{device_type}",
-                device_type=device_type,
-                name=DEVICE_NAMES[device_type],
-                state=device_values.get(device_type, 0),
-            )
-        )
-    return devices
+    return _build_devices(controller_name, DEVICE_TYPES_PUSH, device_values)
 
 
 @pytest.fixture
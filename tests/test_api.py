@@ -38,7 +38,6 @@ from custom_components.honda_generator.api import (
     Permission,
     PollAPI,
     PushAPI,
-    build_change_password_frame,
     _decode_z23w_current,
     _decode_z23w_hours,
     _decode_z23w_power,
@@ -46,6 +45,7 @@ from custom_components.honda_generator.api import (
     _decode_z37a_fuel_level,
     _decode_z37a_fuel_remaining,
     _decode_z37a_power,
+    build_change_password_frame,
     build_unlock_frame,
     create_api,
     get_architecture_from_device_name,
@@ -61,37 +61,22 @@ from .conftest import TEST_ADDRESS, TEST_PASSWORD
 class TestAPIStaticMethods:
     """Test API static/class methods."""
 
-    def test_get_model_from_serial_eu2200i(self) -> None:
-        """Test EU2200i model detection from serial."""
-        assert API.get_model_from_serial("EAMT1234567") == "EU2200i"
-
-    def test_get_model_from_serial_eu3200i(self) -> None:
-        """Test EU3200i model detection from serial."""
-        assert API.get_model_from_serial("EBKJ1234567") == "EU3200i"
-
-    def test_get_model_from_serial_em5000sx(self) -> None:
-        """Test EM5000SX model detection from serial."""
-        assert API.get_model_from_serial("EBMC1234567") == "EM5000SX"
-
-    def test_get_model_from_serial_em6500sx(self) -> None:
-        """Test EM6500SX model detection from serial."""
-        assert API.get_model_from_serial("EBJC1234567") == "EM6500SX"
-
-    def test_get_model_from_serial_eu7000is(self) -> None:
-        """Test EU7000is model detection from serial."""
-        assert API.get_model_from_serial("EEJD1234567") == "EU7000is"
-
-    def test_get_model_from_serial_unknown(self) -> None:
-        """Test unknown model detection from serial."""
-        assert API.get_model_from_serial("XXXX1234567") == "Unknown"
-
-    def test_get_model_from_serial_short(self) -> None:
-        """Test model detection with short serial."""
-        assert API.get_model_from_serial("EA") == "Unknown"
-
-    def test_get_model_from_serial_empty(self) -> None:
-        """Test model detection with empty serial."""
-        assert API.get_model_from_serial("") == "Unknown"
+    @pytest.mark.parametrize(
+        ("serial", "expected"),
+        [
+            ("EAMT1234567", "EU2200i"),
+            ("EBKJ1234567", "EU3200i"),
+            ("EBMC1234567", "EM5000SX"),
+            ("EBJC1234567", "EM6500SX"),
+            ("EEJD1234567", "EU7000is"),
+            ("XXXX1234567", "Unknown"),
+            ("EA", "Unknown"),  # Too short for a prefix
+            ("", "Unknown"),
+        ],
+    )
+    def test_get_model_from_serial(self, serial: str, expected: str) -> None:
+        """Test model detection from serial prefix."""
+        assert API.get_model_from_serial(serial) == expected
 
 
 class TestArchitecture:
@@ -102,22 +87,25 @@ class TestArchitecture:
         assert Architecture.POLL == "poll"
         assert Architecture.PUSH == "push"
 
-    def test_get_architecture_from_device_name_poll(self) -> None:
-        """Test architecture detection for Poll models."""
-        assert get_architecture_from_device_name("EAMT") == Architecture.POLL
-        assert get_architecture_from_device_name("EBMC") == Architecture.POLL
-        assert get_architecture_from_device_name("EBJC") == Architecture.POLL
-        assert get_architecture_from_device_name("EEJD") == Architecture.POLL
-
-    def test_get_architecture_from_device_name_push(self) -> None:
-        """Test architecture detection for Push models."""
-        assert get_architecture_from_device_name("EBKJ") == Architecture.PUSH
-
-    def test_get_architecture_from_device_name_unknown(self) -> None:
-        """Test architecture detection for unknown devices."""
-        assert get_architecture_from_device_name("UNKNOWN") == Architecture.POLL
-        assert get_architecture_from_device_name("") == Architecture.POLL
-        assert get_architecture_from_device_name(None) == Architecture.POLL
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("EAMT", Architecture.POLL),
+            ("EBMC", Architecture.POLL),
+            ("EBJC", Architecture.POLL),
+            ("EEJD", Architecture.POLL),
+            ("EBKJ", Architecture.PUSH),
+            # Unknown devices fall back to Poll
+            ("UNKNOWN", Architecture.POLL),
+            ("", Architecture.POLL),
+            (None, Architecture.POLL),
+        ],
+    )
+    def test_get_architecture_from_device_name(
+        self, name: str | None, expected: Architecture
+    ) -> None:
+        """Test architecture detection from the advertised device name."""
+        assert get_architecture_from_device_name(name) == expected
 
 
 class TestAPIFactory:
@@ -437,6 +425,20 @@ class TestAPIWarningsFaults:
         assert mock_api.get_warning_bit(2) is False
         assert mock_api.get_warning_bit(3) is True
 
+    def test_high_fault_bit(self, mock_api: PollAPI) -> None:
+        """Test fault bits beyond the first 32 (multi-register profiles)."""
+        mock_api._faults_raw = 1 << 52
+        assert mock_api.get_fault_bit(52) is True
+        assert mock_api.get_fault_bit(51) is False
+
+    @pytest.mark.parametrize("bit", [-1, 64])
+    def test_out_of_range_bit_rejected(self, mock_api: PollAPI, bit: int) -> None:
+        """Test bits outside 0-63 raise instead of reading the wrong mask."""
+        with pytest.raises(ValueError):
+            mock_api.get_warning_bit(bit)
+        with pytest.raises(ValueError):
+            mock_api.get_fault_bit(bit)
+
 
 class TestDeviceTypes:
     """Test device type definitions."""
@@ -778,6 +780,15 @@ class TestPushAPICAN:
         assert mock_push_api._state["voltage"] == 120
         assert abs(mock_push_api._state["current"] - 8.33) < 0.01
 
+    def test_parse_can_message_inv_info_short(self, mock_push_api: PushAPI) -> None:
+        """Test a truncated INV_INFO payload updates only the fields it carries."""
+        mock_push_api._state["current"] = 1.5
+        mock_push_api._parse_can_message(0x332, bytes([0x03, 0xE8, 0x00, 0x78]))
+
+        assert mock_push_api._state["power_watts"] == 1000
+        assert mock_push_api._state["voltage"] == 120
+        assert mock_push_api._state["current"] == 1.5
+
     def test_parse_can_message_ecu_status(self, mock_push_api: PushAPI) -> None:
         """Test parsing ECU_STATUS CAN message."""
         # ECU_STATUS (0x312): engine_mode=1 (running), eco_status=0 (ECO on)
@@ -1079,6 +1090,15 @@ class TestPushFrameDispatch:
         assert mock_push_api.get_warning_bit(17) is True
         assert mock_push_api.get_fault_bit(17) is True
 
+    def test_fault_bit_checks_every_unit(self, mock_push_api: PushAPI) -> None:
+        """Fault bits come from the ECU, inverter, or Bluetooth unit error lists."""
+        mock_push_api._state["inv_errors"] = [4]
+        mock_push_api._state["bt_errors"] = [9]
+        assert mock_push_api.get_fault_bit(4) is True
+        assert mock_push_api.get_fault_bit(9) is True
+        assert mock_push_api.get_fault_bit(5) is False
+        assert mock_push_api.get_warning_bit(4) is False
+
 
 class TestEngineProfileDecoders:
     """Unit tests for the per-ECU diagnostic decoders."""
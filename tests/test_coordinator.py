@@ -2,23 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.honda_generator.api import (
     DEFAULT_PASSWORD,
     APIAuthError,
+    APIConnectionError,
     Device,
     DeviceType,
     DiagnosticCategory,
 )
+from custom_components.honda_generator.const import DOMAIN
 from custom_components.honda_generator.coordinator import HondaGeneratorCoordinator
 from custom_components.honda_generator.services import ServiceType
 
+from .conftest import TEST_ADDRESS
+
 
 @pytest.fixture
 def coordinator(mock_config_entry: MagicMock) -> HondaGeneratorCoordinator:
@@ -644,6 +650,20 @@ class TestSaveRuntimeHours:
         assert len(coordinator._runtime_history) == 0
         coordinator._store.async_save.assert_not_called()
 
+    def test_save_needed_only_for_new_max(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        coordinator._services_initialized = True
+        assert coordinator._runtime_hours_save_needed(0)
+
+        coordinator._stored_runtime_hours = 100
+        assert not coordinator._runtime_hours_save_needed(100)
+        assert not coordinator._runtime_hours_save_needed(99)
+        assert coordinator._runtime_hours_save_needed(101)
+
+        coordinator._services_initialized = False
+        assert coordinator._runtime_hours_save_needed(100)
+
     @pytest.mark.asyncio
     async def test_skips_decrease(self, coordinator: HondaGeneratorCoordinator) -> None:
         coordinator._stored_runtime_hours = 100
@@ -805,14 +825,41 @@ class TestMarkServiceComplete:
         assert "oil_change" not in coordinator._service_due_dates
 
 
-def _registry_entry(unique_id: str, disabled: bool = False) -> MagicMock:
+class TestGetDeviceById:
+    """Test device lookup by type and id."""
+
+    def test_lookup_follows_devices_list(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test lookups reflect a newly assigned devices list."""
+        device = entity_coordinator.get_device_by_id(DeviceType.ECO_MODE, 1)
+        assert device is not None
+        assert device.device_type == DeviceType.ECO_MODE
+
+        assert entity_coordinator.get_device_by_id(DeviceType.ECO_MODE, 99) is None
+
+        entity_coordinator.data.devices = []
+        assert entity_coordinator.get_device_by_id(DeviceType.ECO_MODE, 1) is None
+
+
+def _registry_entry(
+    key: str, disabled: bool = False, controller: str = TEST_ADDRESS
+) -> MagicMock:
     """Build a mock entity-registry entry for category-mapping tests."""
     entry = MagicMock()
-    entry.unique_id = unique_id
+    entry.entity_id = f"sensor.{key}"
+    entry.unique_id = f"{DOMAIN}-{controller}_{key}"
     entry.disabled_by = "user" if disabled else None
     return entry
 
 
+def _registry_event(action: str, entity_id: str) -> MagicMock:
+    """Build a mock entity-registry-updated event."""
+    event = MagicMock()
+    event.data = {"action": action, "entity_id": entity_id}
+    return event
+
+
 class TestEnabledDiagnosticCategories:
     """Test _get_enabled_diagnostic_categories maps every category."""
 
@@ -821,13 +868,13 @@ class TestEnabledDiagnosticCategories:
     ) -> None:
         """Every enabled entity, including fuel, maps to its category."""
         entries = [
-            _registry_entry("abc_runtime_hours"),
-            _registry_entry("abc_output_current"),
-            _registry_entry("abc_output_power"),
-            _registry_entry("abc_eco_mode"),
-            _registry_entry("abc_fuel_level"),
-            _registry_entry("abc_fuel_remaining_time"),
-            _registry_entry("abc_warning_0"),
+            _registry_entry("runtime_hours"),
+            _registry_entry("output_current"),
+            _registry_entry("output_power"),
+            _registry_entry("eco_mode"),
+            _registry_entry("fuel_level"),
+            _registry_entry("fuel_remaining_time"),
+            _registry_entry("warning_0"),
         ]
         with patch(
             "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
@@ -844,8 +891,8 @@ class TestEnabledDiagnosticCategories:
     ) -> None:
         """A disabled fuel entity does not enable the fuel category."""
         entries = [
-            _registry_entry("abc_fuel_level", disabled=True),
-            _registry_entry("abc_runtime_hours"),
+            _registry_entry("fuel_level", disabled=True),
+            _registry_entry("runtime_hours"),
         ]
         with patch(
             "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
@@ -856,6 +903,185 @@ class TestEnabledDiagnosticCategories:
         assert DiagnosticCategory.FUEL not in categories
         assert DiagnosticCategory.RUNTIME_HOURS in categories
 
+    def test_unrelated_entities_ignored(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Keys are matched exactly, so a fuel service sensor isn't a fuel read."""
+        entries = [
+            _registry_entry("service_fuel_tank_clean"),
+            _registry_entry("engine_status"),
+            _registry_entry("eco_mode_switch"),
+            _registry_entry("fault_E-12"),
+        ]
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=entries,
+        ):
+            categories = coordinator._get_enabled_diagnostic_categories()
+
+        assert categories == {
+            DiagnosticCategory.ECO_MODE,
+            DiagnosticCategory.WARNINGS_FAULTS,
+        }
+
+    def test_controller_name_differs_from_entry_unique_id(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Entities keyed on a different controller name are still classified."""
+        assert coordinator.config_entry.unique_id != "EU2200i_Other"
+        entries = [
+            _registry_entry("runtime_hours", controller="EU2200i_Other"),
+            _registry_entry("output_power", controller="EU2200i_Other"),
+            _registry_entry("warning_2", controller="EU2200i_Other"),
+        ]
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=entries,
+        ):
+            categories = coordinator._get_enabled_diagnostic_categories()
+
+        assert categories == {
+            DiagnosticCategory.RUNTIME_HOURS,
+            DiagnosticCategory.POWER,
+            DiagnosticCategory.WARNINGS_FAULTS,
+        }
+
+    def test_unrecognized_unique_id_reads_everything(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """An entity whose unique ID can't be classified keeps all reads on."""
+        entry = _registry_entry("runtime_hours")
+        entry.unique_id = "legacy-id"
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=[entry],
+        ):
+            categories = coordinator._get_enabled_diagnostic_categories()
+
+        assert categories == set(DiagnosticCategory)
+
+    def test_result_cached_until_registry_updated(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """The registry is only rescanned after a registry update event."""
+        entries = [_registry_entry("runtime_hours")]
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=entries,
+        ) as mock_entries:
+            first = coordinator._get_enabled_diagnostic_categories()
+            second = coordinator._get_enabled_diagnostic_categories()
+            assert mock_entries.call_count == 1
+            assert first == second == {DiagnosticCategory.RUNTIME_HOURS}
+
+            coordinator._async_registry_updated(
+                _registry_event("remove", "sensor.runtime_hours")
+            )
+            coordinator._get_enabled_diagnostic_categories()
+            assert mock_entries.call_count == 2
+
+    def test_other_config_entry_events_ignored(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Registry events for other integrations keep the cache."""
+        entries = [_registry_entry("runtime_hours")]
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=entries,
+        ):
+            coordinator._get_enabled_diagnostic_categories()
+
+        other = MagicMock()
+        other.config_entry_id = "other_entry"
+        coordinator._entity_registry.async_get.return_value = other
+        event = _registry_event("update", "light.other")
+        assert coordinator._async_is_own_registry_event(event.data) is False
+
+        coordinator._entity_registry.async_get.return_value = None
+        event = _registry_event("remove", "light.gone")
+        assert coordinator._async_is_own_registry_event(event.data) is False
+
+        # A removed entity of this entry is recognised from the last scan
+        event = _registry_event("remove", "sensor.runtime_hours")
+        assert coordinator._async_is_own_registry_event(event.data) is True
+
+    def test_new_entity_for_this_entry_invalidates(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """A newly created entity of this config entry clears the cache."""
+        entries = [_registry_entry("runtime_hours")]
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=entries,
+        ):
+            coordinator._get_enabled_diagnostic_categories()
+
+        created = MagicMock()
+        created.config_entry_id = coordinator.config_entry.entry_id
+        coordinator._entity_registry.async_get.return_value = created
+        event = _registry_event("create", "sensor.fuel_level")
+        assert coordinator._async_is_own_registry_event(event.data) is True
+        coordinator._async_registry_updated(event)
+        assert coordinator._enabled_categories_cache is None
+
+    def test_classification_memoized_across_rescans(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Unique IDs are classified once and reused after invalidation."""
+        entries = [_registry_entry("runtime_hours"), _registry_entry("engine_status")]
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=entries,
+        ):
+            coordinator._get_enabled_diagnostic_categories()
+            assert coordinator._uid_categories == {
+                f"{DOMAIN}-{TEST_ADDRESS}_runtime_hours": (
+                    DiagnosticCategory.RUNTIME_HOURS
+                ),
+                f"{DOMAIN}-{TEST_ADDRESS}_engine_status": None,
+            }
+
+            coordinator._enabled_categories_cache = None
+            categories = coordinator._get_enabled_diagnostic_categories()
+
+        assert categories == {DiagnosticCategory.RUNTIME_HOURS}
+
+    def test_empty_registry_not_cached(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Before entities exist every category is read and nothing is cached."""
+        with patch(
+            "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+            return_value=[],
+        ):
+            categories = coordinator._get_enabled_diagnostic_categories()
+
+        assert categories == set(DiagnosticCategory)
+        assert coordinator._enabled_categories_cache is None
+
+    def test_registry_listener_filtered_to_this_entry(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """The registry listener is registered with this entry's event filter."""
+        coordinator.hass.bus.async_listen.assert_called_once_with(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            coordinator._async_registry_updated,
+            event_filter=coordinator._async_is_own_registry_event,
+        )
+
+    @pytest.mark.asyncio
+    async def test_shutdown_unsubscribes_registry_listener(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Shutting down the coordinator removes the registry listener."""
+        unsub = MagicMock()
+        coordinator._registry_unsub = unsub
+
+        await coordinator.async_shutdown()
+
+        unsub.assert_called_once()
+        assert coordinator._registry_unsub is None
+
 
 class TestCredentialFallbackAndReauth:
     """Test PIN-removal fallback and reauth on auth failure."""
@@ -929,3 +1155,130 @@ class TestCredentialFallbackAndReauth:
         ):
             with pytest.raises(ConfigEntryAuthFailed):
                 await coordinator.async_update_data()
+
+
+class TestForcedReconnect:
+    """Test dropping the connection after repeated failures."""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_runs_in_background(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """The stale API is detached and disconnected off the update path."""
+        coordinator._reconnect_after_failures = 2
+        coordinator._consecutive_failures = 1
+        api = MagicMock()
+        api.connected = True
+        api.get_devices = AsyncMock(side_effect=APIConnectionError("lost"))
+        api.disconnect = AsyncMock()
+        coordinator.api = api
+        coordinator.hass.async_create_background_task = lambda coro, name: (
+            asyncio.get_running_loop().create_task(coro)
+        )
+        with (
+            patch(
+                "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+                return_value=[],
+            ),
+            pytest.raises(UpdateFailed),
+        ):
+            await coordinator.async_update_data()
+
+        assert coordinator.api is None
+        assert coordinator._consecutive_failures == 0
+        assert coordinator._disconnect_task is not None
+        api.disconnect.assert_not_awaited()
+        await coordinator._disconnect_task
+        api.disconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_waits_for_pending_disconnect(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """A new connection is only opened once the old one is torn down."""
+        order: list[str] = []
+
+        async def slow_disconnect() -> None:
+            for _ in range(3):
+                await asyncio.sleep(0)
+            order.append("disconnect")
+
+        coordinator._disconnect_task = asyncio.get_running_loop().create_task(
+            slow_disconnect()
+        )
+        new_api = MagicMock()
+        new_api.connect = AsyncMock(side_effect=lambda: order.append("connect") or True)
+        with patch(
+            "custom_components.honda_generator.coordinator.create_api",
+            return_value=new_api,
+        ):
+            await coordinator._connect(MagicMock())
+
+        assert order == ["disconnect", "connect"]
+        assert coordinator._disconnect_task is None
+        assert coordinator.api is new_api
+
+
+class TestGracePeriodExpiry:
+    """Test the one-time notification when the startup grace period ends."""
+
+    @pytest.mark.asyncio
+    async def test_listeners_notified_once(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Entities are told about the expired grace period only once."""
+        coordinator._startup_grace_period = 0
+        coordinator._reconnect_after_failures = 0
+        coordinator.async_update_listeners = MagicMock()
+        api = MagicMock()
+        api.connected = True
+        api.get_devices = AsyncMock(side_effect=APIConnectionError("lost"))
+        coordinator.api = api
+        for _ in range(2):
+            with (
+                patch(
+                    "homeassistant.helpers.entity_registry.async_entries_for_config_entry",
+                    return_value=[],
+                ),
+                pytest.raises(UpdateFailed),
+            ):
+                await coordinator.async_update_data()
+
+        coordinator.async_update_listeners.assert_called_once()
+
+    def test_expired_grace_period_skips_clock(
+        self, coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Once the expiry is recorded, the property no longer reads the clock."""
+        coordinator._startup_grace_period = 60
+        coordinator._grace_period_check_done = True
+        with patch(
+            "custom_components.honda_generator.coordinator.time.monotonic"
+        ) as monotonic:
+            assert coordinator.in_startup_grace_period is False
+        monotonic.assert_not_called()
+
+
+class TestPushUpdates:
+    """Test Push stream updates are coalesced before reaching listeners."""
+
+    def test_push_frame_schedules_debounced_flush(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """A push frame updates data but defers the listener notification."""
+        entity_coordinator.hass = MagicMock()
+        entity_coordinator._push_debouncer = MagicMock()
+        entity_coordinator.async_set_updated_data = MagicMock()
+
+        entity_coordinator._handle_push_data_update({"current": 7.5})
+
+        device = entity_coordinator.get_device_by_id(DeviceType.CURRENT, 1)
+        assert device is not None and device.state == 7.5
+        entity_coordinator._push_debouncer.async_schedule_call.assert_called_once_with()
+        entity_coordinator.hass.async_create_task.assert_not_called()
+        entity_coordinator.async_set_updated_data.assert_not_called()
+
+        entity_coordinator._async_flush_push_update()
+        entity_coordinator.async_set_updated_data.assert_called_once_with(
+            entity_coordinator.data
+        )
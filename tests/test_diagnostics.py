@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from custom_components.honda_generator.diagnostics import (
+    _redact_address,
     _redact_serial,
     async_get_config_entry_diagnostics,
 )
@@ -34,12 +35,29 @@ class TestRedactSerial:
     def test_long_serial(self) -> None:
         """Test long serial redaction."""
         assert _redact_serial("EAMT-1234567890") == "EAMTXXXXXXXXXXX"
+        assert _redact_serial("EAMT" + "1" * 40) == "EAMT" + "X" * 40
 
     def test_5_char_serial(self) -> None:
         """Test 5-char serial has 1 char redacted."""
         assert _redact_serial("EAMT1") == "EAMTX"
 
 
+class TestRedactAddress:
+    """Test _redact_address function."""
+
+    def test_mac_keeps_first_three_octets(self) -> None:
+        """Test MAC redaction keeps the first 3 octets."""
+        assert _redact_address("AA:BB:CC:DD:EE:FF") == "AA:BB:CC:XX:XX:XX"
+
+    def test_non_mac_returned_unchanged(self) -> None:
+        """Test addresses without colons are returned unchanged."""
+        assert _redact_address("AABBCCDDEEFF") == "AABBCCDDEEFF"
+
+    def test_short_colon_address_returned_unchanged(self) -> None:
+        """Test addresses with too few octets are returned unchanged."""
+        assert _redact_address("AA:BB") == "AA:BB"
+
+
 class TestDiagnosticAssembly:
     """Test async_get_config_entry_diagnostics function."""
 
@@ -66,7 +84,7 @@ class TestDiagnosticAssembly:
 
         runtime_data = MagicMock()
         runtime_data.coordinator = coordinator
-        hass.data = {"honda_generator": {"test_id": runtime_data}}
+        entry.runtime_data = runtime_data
 
         result = await async_get_config_entry_diagnostics(hass, entry)
 
@@ -94,7 +112,7 @@ class TestDiagnosticAssembly:
 
         runtime_data = MagicMock()
         runtime_data.coordinator = coordinator
-        hass.data = {"honda_generator": {"test_id": runtime_data}}
+        entry.runtime_data = runtime_data
 
         result = await async_get_config_entry_diagnostics(hass, entry)
 
@@ -119,7 +137,7 @@ class TestDiagnosticAssembly:
 
         runtime_data = MagicMock()
         runtime_data.coordinator = coordinator
-        hass.data = {"honda_generator": {"test_id": runtime_data}}
+        entry.runtime_data = runtime_data
 
         result = await async_get_config_entry_diagnostics(hass, entry)
 
@@ -127,3 +145,34 @@ class TestDiagnosticAssembly:
         assert "coordinator" in result
         assert result["config_entry"]["entry_id"] == "test_id"
         assert result["coordinator"]["last_update_success"] is True
+
+    @pytest.mark.asyncio
+    async def test_devices_listed(self) -> None:
+        """Test that device states are listed when data is available."""
+        hass = MagicMock()
+        entry = MagicMock()
+        entry.entry_id = "test_id"
+        entry.data = {"address": "AA:BB:CC:DD:EE:FF", "password": "12345678"}
+        entry.options = {}
+
+        device = MagicMock()
+        device.device_type = "runtime_hours"
+        device.name = "Runtime Hours"
+        device.state = 42
+
+        coordinator = MagicMock()
+        coordinator.last_update_success = True
+        coordinator.data.serial_number = "EAMT-1234567"
+        coordinator.data.last_update = None
+        coordinator.data.devices = [device]
+        coordinator.api = None
+
+        runtime_data = MagicMock()
+        runtime_data.coordinator = coordinator
+        entry.runtime_data = runtime_data
+
+        result = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert result["devices"] == [
+            {"type": "runtime_hours", "name": "Runtime Hours", "state": 42}
+        ]
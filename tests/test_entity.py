@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import time
+from datetime import UTC, datetime, timedelta, timezone
 
 from custom_components.honda_generator.binary_sensor import (
     BINARY_SENSOR_DESCRIPTIONS,
     HondaGeneratorBinarySensor,
 )
 from custom_components.honda_generator.coordinator import HondaGeneratorCoordinator
+from custom_components.honda_generator.entity import iso_timestamp
 
 from .conftest import TEST_FIRMWARE, TEST_MODEL, TEST_SERIAL
 
@@ -70,3 +72,34 @@ class TestHondaGeneratorEntity:
 
         info = entity.device_info
         assert info["name"] == f"{TEST_MODEL} ({TEST_SERIAL})"
+
+    def test_device_info_shared_until_firmware_changes(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test entities share one DeviceInfo, rebuilt when firmware changes."""
+        first = HondaGeneratorBinarySensor(
+            entity_coordinator, BINARY_SENSOR_DESCRIPTIONS[0]
+        )
+        second = HondaGeneratorBinarySensor(
+            entity_coordinator, BINARY_SENSOR_DESCRIPTIONS[1]
+        )
+
+        info = first.device_info
+        assert second.device_info is info
+
+        entity_coordinator.data.firmware_version = "2.0.0"
+
+        assert first.device_info is not info
+        assert second.device_info["sw_version"] == "2.0.0"
+
+
+class TestIsoFormatting:
+    """Test cached timestamp formatting."""
+
+    def test_equal_instants_keep_their_offsets(self) -> None:
+        """Test equal instants in different zones are formatted separately."""
+        utc = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        local = utc.astimezone(timezone(timedelta(hours=-8)))
+
+        assert iso_timestamp(utc) == "2026-01-01T12:00:00+00:00"
+        assert iso_timestamp(local) == "2026-01-01T04:00:00-08:00"
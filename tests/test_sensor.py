@@ -3,18 +3,26 @@
 from __future__ import annotations
 
 import time
-from unittest.mock import MagicMock
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+from homeassistant.components.sensor import SensorStateClass
 
 from custom_components.honda_generator.api import DeviceType
 from custom_components.honda_generator.coordinator import HondaGeneratorCoordinator
 from custom_components.honda_generator.sensor import (
+    _SENSOR_CLASSES,
     EU3200I_SENSOR_DESCRIPTIONS,
+    FUEL_SENSOR_DESCRIPTIONS,
     POLL_SENSOR_DESCRIPTIONS,
+    PUSH_SENSOR_DESCRIPTIONS,
     HondaGeneratorPersistentEnumSensor,
     HondaGeneratorPersistentMeasurementSensor,
     HondaGeneratorPersistentSensor,
     HondaGeneratorSensor,
+    _enum_table,
+    _lookup_enum,
 )
 
 
@@ -26,6 +34,59 @@ def _get_description(key: str, descriptions=POLL_SENSOR_DESCRIPTIONS):
     raise ValueError(f"Description not found: {key}")
 
 
+class TestSensorDescriptions:
+    """Test the sensor description tables."""
+
+    def test_push_descriptions_derived_from_poll(self) -> None:
+        """Test Push sensors are the Poll non-enum sensors with finer current."""
+        assert [desc.key for desc in PUSH_SENSOR_DESCRIPTIONS] == [
+            "runtime_hours",
+            "output_current",
+            "output_power",
+            "output_voltage",
+        ]
+        push_current = _get_description("output_current", PUSH_SENSOR_DESCRIPTIONS)
+        assert push_current.suggested_display_precision == 2
+        assert _get_description("output_current").suggested_display_precision == 1
+        assert _get_description(
+            "output_power", PUSH_SENSOR_DESCRIPTIONS
+        ) is _get_description("output_power")
+
+    def test_sensor_class_table(self) -> None:
+        """Test the class table matches the description flags."""
+        for desc in (
+            POLL_SENSOR_DESCRIPTIONS
+            + FUEL_SENSOR_DESCRIPTIONS
+            + PUSH_SENSOR_DESCRIPTIONS
+            + EU3200I_SENSOR_DESCRIPTIONS
+        ):
+            total = desc.state_class == SensorStateClass.TOTAL_INCREASING
+            key = (desc.persist_value, total, desc.enum_keys is not None)
+            if desc.persist_value and total:
+                expected = HondaGeneratorPersistentSensor
+            elif desc.persist_value:
+                expected = HondaGeneratorPersistentMeasurementSensor
+            elif desc.enum_keys is not None:
+                expected = HondaGeneratorPersistentEnumSensor
+            else:
+                expected = HondaGeneratorSensor
+            assert _SENSOR_CLASSES.get(key, HondaGeneratorSensor) is expected
+
+
+class TestEnumLookup:
+    """Test tuple-indexed enum lookups."""
+
+    def test_sparse_keys_and_out_of_range(self) -> None:
+        """Test gaps and out-of-range values fall back to unknown_N."""
+        table = _enum_table({0: "no_error", 1: "co_detected", 5: "fault"})
+
+        assert _lookup_enum(table, 0) == "no_error"
+        assert _lookup_enum(table, 5) == "fault"
+        assert _lookup_enum(table, 3) == "unknown_3"
+        assert _lookup_enum(table, 6) == "unknown_6"
+        assert _lookup_enum(table, -1) == "unknown_-1"
+
+
 class TestHondaGeneratorSensor:
     """Test basic HondaGeneratorSensor."""
 
@@ -50,6 +111,71 @@ class TestHondaGeneratorSensor:
 
         assert sensor.native_value == 0
 
+    def test_static_attrs_from_description(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test static description fields are copied to _attr_* attributes."""
+        desc = _get_description("output_current")
+        sensor = HondaGeneratorSensor(entity_coordinator, desc)
+
+        assert sensor._attr_device_class is desc.device_class
+        assert (
+            sensor._attr_native_unit_of_measurement is desc.native_unit_of_measurement
+        )
+        assert sensor._attr_suggested_display_precision == 1
+        assert sensor._attr_translation_key == "output_current"
+        assert sensor._attr_options is None
+
+    def test_state_write_reuses_device_index(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test value and availability reads share the coordinator's index."""
+        desc = _get_description("output_current")
+        sensor = HondaGeneratorSensor(entity_coordinator, desc)
+        assert sensor.native_value == 5.5
+        index = entity_coordinator._device_index
+
+        for _ in range(2):
+            assert sensor.native_value == 5.5
+            assert sensor.available is True
+
+        assert entity_coordinator._device_index is index
+
+    def test_offline_zero_sensor_available_without_lookup(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test offline zero_when_unavailable sensors skip the device lookup."""
+        desc = _get_description("output_current")
+        sensor = HondaGeneratorSensor(entity_coordinator, desc)
+        device = entity_coordinator.get_device_by_id(DeviceType.CURRENT, 1)
+        device.state = None  # last bounds check failed
+        entity_coordinator.last_update_success = False
+        sensor._get_device_state = MagicMock()
+
+        assert sensor.available is True
+        sensor._get_device_state.assert_not_called()
+
+    def test_state_written_only_on_change(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test unchanged value and availability skip the state write."""
+        desc = _get_description("output_current")
+        sensor = HondaGeneratorSensor(entity_coordinator, desc)
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
+
+        device = entity_coordinator.get_device_by_id(DeviceType.CURRENT, 1)
+        device.state = 6.0
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
+
+        entity_coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 3
+
     def test_zero_when_unavailable(
         self, entity_coordinator: HondaGeneratorCoordinator
     ) -> None:
@@ -108,6 +234,76 @@ class TestHondaGeneratorSensor:
 class TestHondaGeneratorPersistentSensor:
     """Test persistent sensor (runtime_hours)."""
 
+    @pytest.mark.asyncio
+    async def test_restores_numeric_state(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test a numeric last state and its timestamp are restored."""
+        desc = _get_description("runtime_hours")
+        sensor = HondaGeneratorPersistentSensor(entity_coordinator, desc)
+        last_state = MagicMock()
+        last_state.state = "150.0"
+        last_state.attributes = {"last_update": "2026-01-01T12:00:00+00:00"}
+        sensor.async_get_last_state = AsyncMock(return_value=last_state)
+
+        await sensor.async_added_to_hass()
+
+        assert sensor._restored_value == 150.0
+        assert sensor._restored_last_update == datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        assert sensor._restoration_complete is True
+
+    @pytest.mark.asyncio
+    async def test_restores_whole_hours_as_int(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test an integral last state is restored without a float round trip."""
+        desc = _get_description("runtime_hours")
+        sensor = HondaGeneratorPersistentSensor(entity_coordinator, desc)
+        last_state = MagicMock()
+        last_state.state = "150"
+        last_state.attributes = {}
+        sensor.async_get_last_state = AsyncMock(return_value=last_state)
+
+        await sensor.async_added_to_hass()
+
+        assert sensor._restored_value == 150
+        assert type(sensor._restored_value) is int
+
+    @pytest.mark.asyncio
+    async def test_skips_non_numeric_state(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test unavailable or malformed states are not restored."""
+        desc = _get_description("runtime_hours")
+        for state in ("unavailable", "unknown", "12abc", ""):
+            sensor = HondaGeneratorPersistentSensor(entity_coordinator, desc)
+            last_state = MagicMock()
+            last_state.state = state
+            last_state.attributes = {}
+            sensor.async_get_last_state = AsyncMock(return_value=last_state)
+
+            await sensor.async_added_to_hass()
+
+            assert sensor._restored_value is None
+            assert sensor._restoration_complete is True
+
+    @pytest.mark.asyncio
+    async def test_bad_timestamp_keeps_restored_value(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test an invalid last_update attribute only drops the timestamp."""
+        desc = _get_description("runtime_hours")
+        sensor = HondaGeneratorPersistentSensor(entity_coordinator, desc)
+        last_state = MagicMock()
+        last_state.state = "1e-05"
+        last_state.attributes = {"last_update": "not a date"}
+        sensor.async_get_last_state = AsyncMock(return_value=last_state)
+
+        await sensor.async_added_to_hass()
+
+        assert sensor._restored_value == 1e-05
+        assert sensor._restored_last_update is None
+
     def test_live_data_when_online(
         self, entity_coordinator: HondaGeneratorCoordinator
     ) -> None:
@@ -201,6 +397,29 @@ class TestHondaGeneratorPersistentSensor:
         attrs = sensor.extra_state_attributes
         assert attrs["data_stale"] is True
 
+    def test_attributes_reused_until_timestamp_changes(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test the attribute mapping is only rebuilt when its inputs change."""
+        desc = _get_description("runtime_hours")
+        sensor = HondaGeneratorPersistentSensor(entity_coordinator, desc)
+        entity_coordinator.get_hours_per_day = MagicMock(return_value=2.5)
+        entity_coordinator.data.last_update = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+        attrs = sensor.extra_state_attributes
+        assert sensor.extra_state_attributes is attrs
+        assert attrs["last_update"] == "2026-01-01T12:00:00+00:00"
+
+        entity_coordinator.data.last_update = datetime(
+            2026, 1, 1, 12, 0, 10, tzinfo=UTC
+        )
+        updated = sensor.extra_state_attributes
+        assert updated is not attrs
+        assert updated["last_update"] == "2026-01-01T12:00:10+00:00"
+
+        entity_coordinator.get_hours_per_day = MagicMock(return_value=3.0)
+        assert sensor.extra_state_attributes["usage_rate_hours_per_day"] == 3.0
+
     def test_cleared_restored_value_on_live_update(
         self, entity_coordinator: HondaGeneratorCoordinator
     ) -> None:
@@ -355,3 +574,22 @@ class TestHondaGeneratorPersistentMeasurementSensor:
         entity_coordinator.last_update_success = False
         attrs = sensor.extra_state_attributes
         assert attrs["data_stale"] is True
+
+    def test_repeated_offline_updates_written_once(
+        self, entity_coordinator: HondaGeneratorCoordinator
+    ) -> None:
+        """Test failed polls that change nothing skip the state write."""
+        desc = _get_description("fuel_level", EU3200I_SENSOR_DESCRIPTIONS)
+        sensor = HondaGeneratorPersistentMeasurementSensor(entity_coordinator, desc)
+        sensor.async_write_ha_state = MagicMock()
+        sensor._last_live_value = 50
+        entity_coordinator.last_update_success = False
+
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
+
+        # Reconnecting changes the state, so it is written again
+        entity_coordinator.last_update_success = True
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2